@@ -3,13 +3,58 @@ Example client for Whisper Transcription API
 Demonstrates how to use the API endpoints
 """
 import requests
-import base64
 import json
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib encoder
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    # Much faster than the stdlib encoder for large base64 payloads
+    import orjson
+except ImportError:
+    orjson = None
 
 
 API_BASE_URL = "http://localhost:8000"
 
+# Read size for streaming base64 encoding; must be a multiple of 3 so that
+# each encoded chunk is free of padding and can be concatenated directly
+_B64_CHUNK_SIZE = 57 * 1024
+
+# Retry transient gateway errors with backoff instead of failing on the first
+# one. Transcription requests have no side effects, so POST is safe to retry.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods={"POST"},
+)
+
+# Shared session so repeated calls reuse the same keep-alive connection
+_SESSION = requests.Session()
+_SESSION.headers.update({"Connection": "keep-alive"})
+_SESSION.mount("http://", HTTPAdapter(max_retries=_RETRY, pool_connections=4, pool_maxsize=16))
+
+
+def close():
+    """Close the shared HTTP session and its pooled connections."""
+    _SESSION.close()
+
+
+def _post_json(url: str, payload: dict):
+    """POST a JSON body, serialized with orjson when available."""
+    body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode('utf-8')
+    return _SESSION.post(url, data=body, headers={"Content-Type": "application/json"})
+
 
 def transcribe_from_file(file_path: str, model_size: str = "base"):
     """Upload and transcribe an audio file."""
@@ -19,7 +64,7 @@ def transcribe_from_file(file_path: str, model_size: str = "base"):
         files = {'audio_file': (Path(file_path).name, f, 'audio/wav')}
         data = {'model_size': model_size}
         
-        response = requests.post(url, files=files, data=data)
+        response = _SESSION.post(url, files=files, data=data)
     
     if response.status_code == 200:
         return response.json()
@@ -28,10 +73,14 @@ def transcribe_from_file(file_path: str, model_size: str = "base"):
 
 
 def transcribe_from_blob(audio_blob_data: dict):
-    """Transcribe from blob data (similar to JavaScript recordedAudioRef)."""
+    """
+    Transcribe from blob data (similar to JavaScript recordedAudioRef).
+    For audio that is already in a local file, prefer transcribe_from_file,
+    which uploads the raw bytes without base64 encoding.
+    """
     url = f"{API_BASE_URL}/transcribe-blob"
     
-    response = requests.post(url, json=audio_blob_data)
+    response = _post_json(url, audio_blob_data)
     
     if response.status_code == 200:
         return response.json()
@@ -43,7 +92,7 @@ def transcribe_from_server_path(file_path: str):
     """Transcribe from a file path on the server."""
     url = f"{API_BASE_URL}/transcribe-file-path"
     
-    response = requests.post(url, json={"file_path": file_path})
+    response = _post_json(url, {"file_path": file_path})
     
     if response.status_code == 200:
         return response.json()
@@ -58,7 +107,7 @@ def convert_file_to_blob_data(file_path: str):
     """
     url = f"{API_BASE_URL}/convert-file-to-blob"
     
-    response = requests.post(url, json={"file_path": file_path})
+    response = _post_json(url, {"file_path": file_path})
     
     if response.status_code == 200:
         return response.json()
@@ -66,111 +115,196 @@ def convert_file_to_blob_data(file_path: str):
         raise Exception(f"API Error: {response.status_code} - {response.text}")
 
 
+def read_wav_duration(file_path: str) -> float:
+    """
+    Get the duration of a WAV file from its RIFF headers, without decoding.
+    Only chunk headers are read; chunk bodies other than "fmt " are skipped.
+    Returns 0.0 if the file is not a WAV file or its headers are malformed.
+    """
+    file_size = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        riff_header = f.read(12)
+        if len(riff_header) < 12 or riff_header[:4] != b'RIFF' or riff_header[8:12] != b'WAVE':
+            return 0.0
+        
+        byte_rate = 0
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                return 0.0
+            chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+            padded_size = chunk_size + (chunk_size & 1)  # Chunks are word-aligned
+            
+            if chunk_id == b'fmt ':
+                fmt = f.read(padded_size)
+                if len(fmt) < 12:
+                    return 0.0
+                byte_rate = struct.unpack_from('<I', fmt, 8)[0]
+            elif chunk_id == b'data':
+                # Streamed WAVs may leave a placeholder size (0xFFFFFFFF), so
+                # never count more data than the file actually holds
+                data_size = min(chunk_size, file_size - f.tell())
+                return data_size / byte_rate if byte_rate else 0.0
+            else:
+                f.seek(padded_size, os.SEEK_CUR)
+
+
 def create_blob_data_from_local_file(file_path: str) -> dict:
     """
     Create blob data structure from a local file (client-side conversion).
     This creates a structure similar to JavaScript recordedAudioRef.
+    
+    Deprecated for transcribing local files: base64 inflates the upload by a
+    third and costs encode/decode time on both ends. Use
+    prefer_multipart_when_local instead.
     """
     from datetime import datetime
     
-    with open(file_path, 'rb') as f:
-        audio_bytes = f.read()
-    
-    # Encode to base64
-    audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
+    # Encode to base64 in chunks so the raw audio is never fully resident.
+    # Each chunk is read into the same buffer and passed on as a memoryview
+    # slice, so no per-chunk bytes objects are created.
+    buf = bytearray()
+    chunk = bytearray(_B64_CHUNK_SIZE)
+    chunk_view = memoryview(chunk)
+    with open(file_path, 'rb', buffering=64 * 1024) as f:
+        while n := f.readinto(chunk):
+            buf.extend(base64.b64encode(chunk_view[:n]))
+    audio_base64 = buf.decode('ascii')
     
     # Get file size
-    file_size = len(audio_bytes)
+    file_size = os.path.getsize(file_path)
     
     # For simplicity, assuming it's a WAV file
-    # In production, you might want to calculate actual duration
+    # The server falls back to "blob" when "wavBlob" is absent, so the audio is
+    # sent once rather than duplicated under both keys
     blob_data = {
         "blob": audio_base64,
-        "wavBlob": audio_base64,
         "mimeType": "audio/wav",
         "size": file_size,
         "wavSize": file_size,
-        "duration": 0.0,  # Will be calculated by server if needed
+        "duration": read_wav_duration(file_path),
         "timestamp": datetime.now().isoformat()
     }
     
     return blob_data
 
 
-# Example usage
-if __name__ == "__main__":
-    print("="*60)
-    print("Whisper API Client Examples")
-    print("="*60)
+def batch_create_blob_data(file_paths: list) -> list:
+    """
+    Create blob data for many local files in parallel.
+    Base64 encoding is CPU-bound, so each file is encoded in a separate
+    process to use all cores instead of contending for the GIL.
+    """
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(create_blob_data_from_local_file, file_paths))
+
+
+def prefer_multipart_when_local(audio, model_size: str = "base"):
+    """
+    Transcribe audio using the cheapest endpoint for its source.
     
-    # Example 1: Transcribe by uploading a file
-    print("\n1️⃣  Example 1: Upload and transcribe a file")
+    Local file paths are uploaded as raw bytes via multipart /transcribe.
+    Only in-memory blob data (e.g. captured in the browser) goes through
+    the base64 /transcribe-blob endpoint.
+    """
+    if isinstance(audio, dict):
+        return transcribe_from_blob(audio)
+    return transcribe_from_file(str(audio), model_size)
+
+
+# Examples. Each returns its output lines so the examples can run
+# concurrently without interleaving their printed output.
+def example_upload_file():
+    """Example 1: Transcribe by uploading a file."""
+    lines = ["\n1️⃣  Example 1: Upload and transcribe a file"]
     try:
         # Replace with your actual audio file path
         audio_file = "./arth_rp.wav"
         
         if Path(audio_file).exists():
             result = transcribe_from_file(audio_file)
-            print(f"✅ Transcription: {result['transcription']}")
-            print(f"   Duration: {result['duration']:.2f}s")
-            print(f"   Sample rate: {result['sample_rate']} Hz")
+            lines.append(f"✅ Transcription: {result['transcription']}")
+            lines.append(f"   Duration: {result['duration']:.2f}s")
+            lines.append(f"   Sample rate: {result['sample_rate']} Hz")
         else:
-            print(f"⚠️  File not found: {audio_file}")
+            lines.append(f"⚠️  File not found: {audio_file}")
     except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    # Example 2: Convert file to blob and transcribe
-    print("\n2️⃣  Example 2: Create blob data and transcribe")
+        lines.append(f"❌ Error: {e}")
+    return lines
+
+
+def example_local_file():
+    """Example 2: Transcribe a local file without base64 encoding."""
+    lines = ["\n2️⃣  Example 2: Transcribe a local file (raw multipart upload)"]
     try:
         audio_file = "./arth_rp.wav"
         
         if Path(audio_file).exists():
-            # Create blob data structure (client-side)
-            blob_data = create_blob_data_from_local_file(audio_file)
-            
-            print(f"   Blob size: {blob_data['size']} bytes")
-            print(f"   MIME type: {blob_data['mimeType']}")
+            lines.append(f"   File size: {os.path.getsize(audio_file)} bytes")
             
-            # Send to API for transcription
-            result = transcribe_from_blob(blob_data)
-            print(f"✅ Transcription: {result['transcription']}")
+            # Local files go through /transcribe; blobs are only for in-memory audio
+            result = prefer_multipart_when_local(audio_file)
+            lines.append(f"✅ Transcription: {result['transcription']}")
         else:
-            print(f"⚠️  File not found: {audio_file}")
+            lines.append(f"⚠️  File not found: {audio_file}")
     except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    # Example 3: Transcribe from server file path
-    print("\n3️⃣  Example 3: Transcribe from server file path")
+        lines.append(f"❌ Error: {e}")
+    return lines
+
+
+def example_server_path():
+    """Example 3: Transcribe from server file path."""
+    lines = ["\n3️⃣  Example 3: Transcribe from server file path"]
     try:
         # This assumes the file exists on the server
         server_file_path = r"C:\Users\hackuser\InsightLoop\arth_rp.wav"
         
         result = transcribe_from_server_path(server_file_path)
-        print(f"✅ Transcription: {result['transcription']}")
+        lines.append(f"✅ Transcription: {result['transcription']}")
     except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    # Example 4: Convert server file to blob data and transcribe
-    print("\n4️⃣  Example 4: Convert server file to blob data and transcribe")
+        lines.append(f"❌ Error: {e}")
+    return lines
+
+
+def example_server_blob():
+    """Example 4: Convert server file to blob data and transcribe."""
+    lines = ["\n4️⃣  Example 4: Convert server file to blob data and transcribe"]
     try:
         server_file_path = r"C:\Users\hackuser\InsightLoop\arth_rp.wav"
         
         blob_data = convert_file_to_blob_data(server_file_path)
-        print(f"✅ Blob data created:")
-        print(f"   Size: {blob_data['size']} bytes")
-        print(f"   Duration: {blob_data['duration']:.2f}s")
-        print(f"   MIME type: {blob_data['mimeType']}")
-        print(f"   Timestamp: {blob_data['timestamp']}")
+        lines.append(f"✅ Blob data created:")
+        lines.append(f"   Size: {blob_data['size']} bytes")
+        lines.append(f"   Duration: {blob_data['duration']:.2f}s")
+        lines.append(f"   MIME type: {blob_data['mimeType']}")
+        lines.append(f"   Timestamp: {blob_data['timestamp']}")
         
         # Now transcribe the blob data
-        print(f"\n   Transcribing blob data...")
+        lines.append(f"\n   Transcribing blob data...")
         result = transcribe_from_blob(blob_data)
-        print(f"✅ Transcription: {result['transcription']}")
-        print(f"   Processing time: {result['duration']:.2f}s")
+        lines.append(f"✅ Transcription: {result['transcription']}")
+        lines.append(f"   Processing time: {result['duration']:.2f}s")
     except Exception as e:
-        print(f"❌ Error: {e}")
+        lines.append(f"❌ Error: {e}")
+    return lines
+
+
+# Example usage
+if __name__ == "__main__":
+    print("="*60)
+    print("Whisper API Client Examples")
+    print("="*60)
+    
+    # Run all examples concurrently over the shared session; total time is
+    # the slowest example rather than the sum of all four
+    examples = [example_upload_file, example_local_file, example_server_path, example_server_blob]
+    with ThreadPoolExecutor(max_workers=len(examples)) as executor:
+        futures = [executor.submit(example) for example in examples]
+        for future in as_completed(futures):
+            print("\n".join(future.result()))
     
     print("\n" + "="*60)
     print("For interactive API docs, visit: http://localhost:8000/docs")
     print("="*60)
-
+    
+    close()
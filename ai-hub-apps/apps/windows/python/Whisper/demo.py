@@ -3,93 +3,243 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # ---------------------------------------------------------------------
 import argparse
+import collections
+import functools
 import os
 import subprocess
 import shutil
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# Set FFMPEG_BINARY BEFORE importing any libraries that might need it
-def setup_ffmpeg_early():
-    """Set up ffmpeg environment variables before importing libraries."""
-    # Check if FFMPEG_BINARY is already set
-    if not os.environ.get("FFMPEG_BINARY"):
-        # Try to find ffmpeg
-        ffmpeg_path = shutil.which("ffmpeg")
-        if ffmpeg_path and os.path.exists(ffmpeg_path):
-            os.environ["FFMPEG_BINARY"] = ffmpeg_path
-        else:
-            # Try common Windows locations
-            common_paths = [
-                r"C:\ffmpeg\bin\ffmpeg.exe",
-                r"C:\Program Files\ffmpeg\bin\ffmpeg.exe",
-                r"C:\Users\{}\Downloads\ffmpeg\ffmpeg\bin\ffmpeg.exe".format(os.environ.get("USERNAME", "")),
-            ]
-            for path in common_paths:
-                if os.path.exists(path):
-                    os.environ["FFMPEG_BINARY"] = path
-                    break
-    
-    # Also update PATH in current process to include ffmpeg bin directory
-    if os.environ.get("FFMPEG_BINARY"):
-        ffmpeg_binary = os.environ["FFMPEG_BINARY"]
-        ffmpeg_bin_dir = os.path.dirname(ffmpeg_binary)
-        current_path = os.environ.get("PATH", "")
-        if ffmpeg_bin_dir not in current_path:
-            os.environ["PATH"] = ffmpeg_bin_dir + os.pathsep + current_path
-
-# Setup ffmpeg BEFORE importing libraries
-setup_ffmpeg_early()
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
-import sounddevice as sd
-from qai_hub_models.models._shared.hf_whisper.app import HfWhisperApp
-from qai_hub_models.utils.onnx.torch_wrapper import OnnxModelTorchWrapper
+# Audio format expected by the Whisper app
+TARGET_SAMPLE_RATE = 16000
 
+# Common Windows install locations checked when ffmpeg is not on PATH
+FFMPEG_COMMON_PATHS = (
+    r"C:\ffmpeg\bin\ffmpeg.exe",
+    r"C:\Program Files\ffmpeg\bin\ffmpeg.exe",
+    r"C:\Users\{}\Downloads\ffmpeg\ffmpeg\bin\ffmpeg.exe".format(os.environ.get("USERNAME", "")),
+)
 
-def check_ffmpeg():
-    """Check if ffmpeg is installed and accessible."""
-    # Check if FFMPEG_BINARY is already set
-    if os.environ.get("FFMPEG_BINARY"):
-        ffmpeg_binary = os.environ.get("FFMPEG_BINARY")
-        if os.path.exists(ffmpeg_binary):
-            print(f"✅ FFmpeg found via FFMPEG_BINARY: {ffmpeg_binary}")
-            return True
+
+@functools.lru_cache(maxsize=1)
+def _resolve_ffmpeg():
+    """
+    Locate ffmpeg once per process.
+    
+    Returns:
+        Tuple of (binary_path, verified); binary_path is None if not found
+    """
+    # An explicit FFMPEG_BINARY wins if it points at a real file
+    ffmpeg_binary = os.environ.get("FFMPEG_BINARY")
+    if ffmpeg_binary and os.path.isfile(ffmpeg_binary):
+        return ffmpeg_binary, True
     
     # Check if ffmpeg is in PATH
     ffmpeg_path = shutil.which("ffmpeg")
     if ffmpeg_path:
+        if not ffmpeg_binary:
+            return ffmpeg_path, True
+        # FFMPEG_BINARY was set but is stale, so make sure this one actually runs
         try:
-            # Try to run ffmpeg to verify it works
-            result = subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            result = subprocess.run([ffmpeg_path, "-version"], capture_output=True, timeout=5)
             if result.returncode == 0:
-                print(f"✅ FFmpeg found at: {ffmpeg_path}")
-                # Set FFMPEG_BINARY for Python libraries that need it
-                os.environ["FFMPEG_BINARY"] = ffmpeg_path
-                return True
+                return ffmpeg_path, True
         except Exception as e:
             print(f"⚠️  FFmpeg found but failed to run: {e}")
     
     # Try common Windows locations
-    common_paths = [
-        r"C:\ffmpeg\bin\ffmpeg.exe",
-        r"C:\Program Files\ffmpeg\bin\ffmpeg.exe",
-        r"C:\Users\{}\Downloads\ffmpeg\ffmpeg\bin\ffmpeg.exe".format(os.environ.get("USERNAME", "")),
-    ]
+    for path in FFMPEG_COMMON_PATHS:
+        if os.path.isfile(path):
+            return path, True
+    
+    return None, False
+
+
+# Set FFMPEG_BINARY BEFORE importing any libraries that might need it
+def setup_ffmpeg_early():
+    """Set up ffmpeg environment variables before importing libraries."""
+    ffmpeg_binary, verified = _resolve_ffmpeg()
+    if not verified:
+        return
+    os.environ["FFMPEG_BINARY"] = ffmpeg_binary
+    
+    # Also update PATH in current process to include ffmpeg bin directory
+    ffmpeg_bin_dir = os.path.dirname(ffmpeg_binary)
+    current_path = os.environ.get("PATH", "")
+    if ffmpeg_bin_dir not in current_path:
+        os.environ["PATH"] = ffmpeg_bin_dir + os.pathsep + current_path
+
+# Setup ffmpeg BEFORE importing libraries. sounddevice and qai_hub_models
+# (which pulls in torch and onnxruntime) are imported inside main() only once
+# they are needed, so e.g. --list-audio-devices starts quickly.
+setup_ffmpeg_early()
+
+
+def _is_target_format(wav_file):
+    return (wav_file.getframerate(), wav_file.getnchannels(), wav_file.getsampwidth()) == (TARGET_SAMPLE_RATE, 1, 2)
+
+
+def is_target_wav(audio_file):
+    """Check from the header alone whether a file is already 16 kHz mono 16-bit PCM WAV."""
+    try:
+        with wave.open(audio_file, 'rb') as wav_file:
+            return _is_target_format(wav_file)
+    except (wave.Error, EOFError):
+        return False
+
+
+def read_target_wav_frames(audio_file):
+    """
+    Read the raw frames of a WAV that is already 16 kHz mono 16-bit PCM.
     
-    for path in common_paths:
-        if os.path.exists(path):
-            print(f"✅ FFmpeg found at: {path}")
-            os.environ["FFMPEG_BINARY"] = path
-            return True
+    Returns:
+        The PCM frames as bytes, or None if the file needs converting
+    """
+    try:
+        with wave.open(audio_file, 'rb') as wav_file:
+            if not _is_target_format(wav_file):
+                return None
+            return wav_file.readframes(wav_file.getnframes())
+    except (wave.Error, EOFError):
+        # Not a PCM WAV file (e.g. MP3, FLAC or compressed WAV)
+        return None
+
+
+def run_ffmpeg(cmd, timeout=30):
+    """
+    Run an ffmpeg command and return its stdout.
+    
+    stderr is drained line by line on a separate thread and only its tail is
+    kept for error reporting, so long inputs don't buffer the whole log.
+    """
+    stderr_tail = collections.deque(maxlen=20)
+    
+    with subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+        def drain_stderr():
+            for line in proc.stderr:
+                stderr_tail.append(line.decode(errors='replace').rstrip())
+        
+        stderr_thread = threading.Thread(target=drain_stderr, daemon=True)
+        stderr_thread.start()
+        timer = threading.Timer(timeout, proc.kill)
+        timer.start()
+        try:
+            output = proc.stdout.read()
+            proc.wait()
+        finally:
+            timer.cancel()
+        stderr_thread.join()
+    
+    if proc.returncode != 0:
+        raise Exception("FFmpeg conversion failed: " + "\n".join(stderr_tail))
+    return output
+
+
+def resolve_audio_file(audio_file):
+    """
+    Find the audio file to transcribe, printing usage help if it is missing.
+    
+    Returns:
+        The absolute path to the audio file, or None if it was not found
+    """
+    if audio_file is None:
+        print("Error: No audio file specified.")
+        print("Usage: python demo.py --audio-file <path_to_wav_file>")
+        print("   or: python demo.py --stream-audio-device <device_number>")
+        return None
+
+    # Validate file exists - check multiple locations:
+    # 1. An absolute path or relative to the current directory
+    # 2. Relative to the script's directory
+    for candidate in (audio_file, os.path.join(_SCRIPT_DIR, audio_file)):
+        file_path = os.path.abspath(candidate)
+        try:
+            os.stat(file_path)
+            break
+        except OSError:
+            continue
+    else:
+        print(f"Error: Audio file not found: {audio_file}")
+        print(f"  Searched in:")
+        print(f"    - Current directory: {os.getcwd()}")
+        print(f"    - Script directory: {_SCRIPT_DIR}")
+        print(f"\nTip: Use absolute path or place .wav file in one of the above directories.")
+        return None
+
+    return file_path
+
+
+def decode_audio(audio_file):
+    """
+    Decode an audio file to 16 kHz mono float32 samples.
+    
+    Returns:
+        Tuple of (audio_data, sample_rate)
+    """
+    # Load audio using ffmpeg directly (audio2numpy has issues detecting ffmpeg)
+    import numpy as np
+    
+    # Fast path: a WAV already in the model's format needs no conversion
+    frames = read_target_wav_frames(audio_file)
+    if frames is not None:
+        print("Audio is already 16 kHz mono 16-bit PCM, skipping ffmpeg")
+    else:
+        ffmpeg_binary = _resolve_ffmpeg()[0]
+        if not ffmpeg_binary:
+            raise Exception("FFmpeg not found. Please ensure FFMPEG_BINARY is set or ffmpeg is in PATH.")
+
+        print(f"Loading audio using ffmpeg: {ffmpeg_binary}")
+
+        # Use ffmpeg to decode straight to raw 16-bit PCM on stdout
+        cmd = [
+            ffmpeg_binary,
+            "-hide_banner", "-nostats",
+            "-i", audio_file,
+            "-ar", "16000",          # Sample rate
+            "-ac", "1",              # Mono
+            "-f", "s16le",           # Raw PCM, no WAV header
+            "-acodec", "pcm_s16le",
+            "-"                      # Write to stdout
+        ]
+
+        frames = run_ffmpeg(cmd, timeout=30)
+
+    sample_rate = TARGET_SAMPLE_RATE
+    # Normalize to [-1, 1] with a single int16 -> float32 multiply pass
+    raw_i16 = np.frombuffer(frames, dtype=np.int16)
+    audio_data = np.empty(raw_i16.shape, dtype=np.float32)
+    np.multiply(raw_i16, np.float32(1.0 / 32768.0), out=audio_data, casting='unsafe')
+    
+    return audio_data, sample_rate
+
+
+def check_ffmpeg():
+    """Check if ffmpeg is installed and accessible."""
+    ffmpeg_binary, verified = _resolve_ffmpeg()
+    if verified:
+        print(f"✅ FFmpeg found at: {ffmpeg_binary}")
+        # Set FFMPEG_BINARY for Python libraries that need it
+        os.environ["FFMPEG_BINARY"] = ffmpeg_binary
+        return True
     
     print("❌ FFmpeg not found in PATH or common locations")
     return False
 
 
+def print_transcription(timestamp, future):
+    """Print the result of a background transcription, tagged with its record time."""
+    transcription = future.result()
+    if transcription.strip():
+        print(f"[{timestamp}] {transcription}")
+    else:
+        print(f"[{timestamp}] (no speech detected)")
+
+
 def print_ffmpeg_instructions():
     """Print instructions for installing ffmpeg on Windows."""
     print("\n" + "="*60)
@@ -164,11 +314,42 @@ def main():
     )
     args = parser.parse_args()
 
+    import sounddevice as sd
+
     if args.list_audio_devices:
         print(sd.query_devices())
         return
 
+    if not args.stream_audio_device:
+        audio_file = resolve_audio_file(args.audio_file)
+        if audio_file is None:
+            return
+        
+        # Check if it's a .wav file (optional validation)
+        if not audio_file.lower().endswith('.wav'):
+            print(f"Warning: File '{audio_file}' doesn't have .wav extension.")
+            print("The file will be processed, but .wav format is recommended.")
+        
+        # FFmpeg should already be checked and set up before model loading
+        # But verify it's still accessible. A WAV already in the model's
+        # format is decoded without it, so it is only required for other files.
+        if not os.environ.get("FFMPEG_BINARY") and not is_target_wav(audio_file):
+            print("⚠️  Warning: FFMPEG_BINARY not set. Attempting to set it now...")
+            if not check_ffmpeg():
+                print_ffmpeg_instructions()
+                return
+        
+        # Decode the audio on a background thread while the model loads. ffmpeg
+        # runs in its own process and ONNX session setup releases the GIL, so
+        # the two genuinely overlap.
+        decode_executor = ThreadPoolExecutor(max_workers=1)
+        decode_future = decode_executor.submit(decode_audio, audio_file)
+        decode_executor.shutdown(wait=False)
+
     print("Loading model...")
+    from qai_hub_models.models._shared.hf_whisper.app import HfWhisperApp
+    from qai_hub_models.utils.onnx.torch_wrapper import OnnxModelTorchWrapper
+
     app = HfWhisperApp(
         OnnxModelTorchWrapper.OnNPU(args.encoder_path),
         OnnxModelTorchWrapper.OnNPU(args.decoder_path),
@@ -186,70 +367,47 @@ def main():
         print(f"Recording {chunk_duration} seconds per chunk...")
         print("Press Ctrl+C to stop\n")
         
+        # Transcribe each chunk on a worker thread while the next one records,
+        # so no audio is lost during inference. A single worker keeps the
+        # transcriptions in recording order.
+        chunk_samples = sample_rate * chunk_duration
+        pending = None
+        
+        # Two recording buffers, reused across iterations: one is filled while
+        # the other is being transcribed
+        buffers = [np.empty((chunk_samples, 1), dtype=np.float32) for _ in range(2)]
+        chunk_index = 0
+        
         try:
-            while True:
-                # Record audio chunk
-                chunk_samples = sample_rate * chunk_duration
-                audio_chunk = sd.rec(
-                    chunk_samples,
-                    samplerate=sample_rate,
-                    channels=1,
-                    device=args.stream_audio_device,
-                    dtype=np.float32
-                )
-                sd.wait()  # Wait until recording is finished
-                
-                # Transcribe
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                transcription = app.transcribe(audio_chunk.flatten(), sample_rate)
-                
-                if transcription.strip():
-                    print(f"[{timestamp}] {transcription}")
-                else:
-                    print(f"[{timestamp}] (no speech detected)")
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                while True:
+                    # Start recording the next audio chunk (sd.rec returns immediately)
+                    audio_chunk = buffers[chunk_index % 2]
+                    chunk_index += 1
+                    sd.rec(
+                        samplerate=sample_rate,
+                        channels=1,
+                        device=args.stream_audio_device,
+                        dtype=np.float32,
+                        out=audio_chunk
+                    )
+                    
+                    # Report the previous chunk while this one records
+                    if pending is not None:
+                        print_transcription(*pending)
+                    
+                    sd.wait()  # Wait until recording is finished
+                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    
+                    # Transcribe in the background while the next chunk records.
+                    # audio_chunk[:, 0] is a contiguous 1-D view, not a copy. This is
+                    # safe because a buffer is only recorded into again after its
+                    # transcription has been printed above.
+                    pending = (timestamp, executor.submit(app.transcribe, audio_chunk[:, 0], sample_rate))
                     
         except KeyboardInterrupt:
             print("\n\nStopping transcription...")
     else:
-        audio_file = args.audio_file
-        if audio_file is None:
-            print("Error: No audio file specified.")
-            print("Usage: python demo.py --audio-file <path_to_wav_file>")
-            print("   or: python demo.py --stream-audio-device <device_number>")
-            return
-        
-        # Validate file exists - check multiple locations
-        file_path = None
-        
-        # 1. Check if it's an absolute path or relative to current directory
-        if os.path.exists(audio_file):
-            file_path = os.path.abspath(audio_file)
-        # 2. Check if it's relative to the script's directory
-        elif os.path.exists(os.path.join(os.path.dirname(__file__), audio_file)):
-            file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), audio_file))
-        else:
-            print(f"Error: Audio file not found: {audio_file}")
-            print(f"  Searched in:")
-            print(f"    - Current directory: {os.getcwd()}")
-            print(f"    - Script directory: {os.path.dirname(os.path.abspath(__file__))}")
-            print(f"\nTip: Use absolute path or place .wav file in one of the above directories.")
-            return
-        
-        audio_file = file_path  # Use the resolved path
-        
-        # Check if it's a .wav file (optional validation)
-        if not audio_file.lower().endswith('.wav'):
-            print(f"Warning: File '{audio_file}' doesn't have .wav extension.")
-            print("The file will be processed, but .wav format is recommended.")
-        
-        # FFmpeg should already be checked and set up before model loading
-        # But verify it's still accessible
-        if not os.environ.get("FFMPEG_BINARY"):
-            print("⚠️  Warning: FFMPEG_BINARY not set. Attempting to set it now...")
-            if not check_ffmpeg():
-                print_ffmpeg_instructions()
-                return
-        
         # Perform transcription
         print(f"\nLoading audio file: {audio_file}")
         print(f"Starting transcription at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -260,55 +418,7 @@ def main():
             print(f"Using FFMPEG_BINARY: {os.environ['FFMPEG_BINARY']}")
         
         try:
-            # Load audio using ffmpeg directly (audio2numpy has issues detecting ffmpeg)
-            import numpy as np
-            
-            ffmpeg_binary = os.environ.get("FFMPEG_BINARY") or shutil.which("ffmpeg")
-            if not ffmpeg_binary:
-                raise Exception("FFmpeg not found. Please ensure FFMPEG_BINARY is set or ffmpeg is in PATH.")
-            
-            print(f"Loading audio using ffmpeg: {ffmpeg_binary}")
-            
-            # Use ffmpeg to convert to standard WAV format, then load with numpy
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                tmp_wav = tmp_file.name
-            
-            # Convert to standard WAV format using ffmpeg
-            cmd = [
-                ffmpeg_binary,
-                "-i", audio_file,
-                "-ar", "16000",  # Sample rate
-                "-ac", "1",      # Mono
-                "-f", "wav",     # WAV format
-                "-y",            # Overwrite output
-                tmp_wav
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if result.returncode != 0:
-                raise Exception(f"FFmpeg conversion failed: {result.stderr}")
-            
-            # Load the converted WAV file using scipy or wave
-            try:
-                from scipy.io import wavfile
-                sample_rate, audio_data = wavfile.read(tmp_wav)
-                audio_data = audio_data.astype(np.float32) / 32768.0  # Normalize to [-1, 1]
-            except ImportError:
-                import wave
-                with wave.open(tmp_wav, 'rb') as wav_file:
-                    sample_rate = wav_file.getframerate()
-                    frames = wav_file.readframes(-1)
-                    audio_data = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
-            
-            # Clean up temp file
-            os.unlink(tmp_wav)
+            audio_data, sample_rate = decode_future.result()
             
             print(f"✅ Audio loaded: {len(audio_data)} samples at {sample_rate} Hz")
             
@@ -2,13 +2,23 @@
 # Copyright (c) 2025 Qualcomm Technologies, Inc. and/or its subsidiaries.
 # SPDX-License-Identifier: BSD-3-Clause
 # ---------------------------------------------------------------------
+import asyncio
 import os
 import subprocess
 import shutil
+import struct
 import io
+import mmap
 import base64
+import binascii
+import hashlib
+import threading
+import time
+import wave
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 # Set FFMPEG_BINARY BEFORE importing any libraries that might need it
 def setup_ffmpeg_early():
@@ -37,7 +47,10 @@ def setup_ffmpeg_early():
 
 setup_ffmpeg_early()
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, Form
+# Resolved once; PATH lookups per conversion are wasted syscalls
+_FFMPEG = os.environ.get("FFMPEG_BINARY") or shutil.which("ffmpeg")
+
+from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import numpy as np
@@ -47,6 +60,46 @@ import uvicorn
 from qai_hub_models.models._shared.hf_whisper.app import HfWhisperApp
 from qai_hub_models.utils.onnx.torch_wrapper import OnnxModelTorchWrapper
 
+try:
+    # In-process libav decoding; avoids spawning ffmpeg for every request
+    import av
+except ImportError:
+    av = None
+
+try:
+    from scipy.io import wavfile as _scipy_wavfile
+except ImportError:
+    _scipy_wavfile = None
+
+
+# Audio format expected by the Whisper app
+TARGET_SAMPLE_RATE = 16000
+
+# Reciprocal full-scale factors for integer PCM -> float32 in [-1, 1)
+_INV_I16 = np.float32(1.0 / 32768.0)
+_INV_I32 = np.float32(1.0 / 2147483648.0)
+_INV_U8 = np.float32(1.0 / 128.0)
+
+
+def _u8_to_float32(audio_data: np.ndarray) -> np.ndarray:
+    # 8-bit PCM is unsigned with a 128 offset; scale in place after centering
+    centered = np.subtract(audio_data, np.float32(128.0), dtype=np.float32)
+    return np.multiply(centered, _INV_U8, out=centered)
+
+
+# Each conversion is a single fused ufunc pass rather than astype() + divide
+_PCM_TO_FLOAT32 = {
+    np.dtype(np.int16): lambda a: np.multiply(a, _INV_I16, dtype=np.float32),
+    np.dtype(np.int32): lambda a: np.multiply(a, _INV_I32, dtype=np.float32),
+    np.dtype(np.uint8): _u8_to_float32,
+}
+
+
+def _pcm_to_float32(audio_data: np.ndarray) -> np.ndarray:
+    """Normalize integer PCM samples to float32; float input is returned as-is."""
+    convert = _PCM_TO_FLOAT32.get(audio_data.dtype)
+    return convert(audio_data) if convert is not None else audio_data
+
 
 # Pydantic models for request/response
 class TranscriptionResponse(BaseModel):
@@ -70,8 +123,41 @@ class FilePathRequest(BaseModel):
     file_path: str
 
 
-# Global app instance
+# Model settings. The __main__ block copies its --model-size, --encoder-path
+# and --decoder-path arguments into these variables, so that every uvicorn
+# worker (which imports this module afresh) loads the same model.
+MODEL_SIZE = os.environ.get("WHISPER_MODEL_SIZE", "base")
+ENCODER_PATH = os.environ.get(
+    "WHISPER_ENCODER_PATH",
+    "build\\whisper_base_float\\precompiled\\qualcomm-snapdragon-x-elite\\HfWhisperEncoder\\model.onnx"
+)
+DECODER_PATH = os.environ.get(
+    "WHISPER_DECODER_PATH",
+    "build\\whisper_base_float\\precompiled\\qualcomm-snapdragon-x-elite\\HfWhisperDecoder\\model.onnx"
+)
+
+# Global app instance, the model size it was loaded with, and a lock so that
+# concurrent first requests don't each build their own ONNX sessions
 whisper_app = None
+whisper_model_size = None
+_model_lock = threading.Lock()
+
+# The NPU sessions of the shared model are not safe for concurrent passes, so
+# every transcription runs on this single thread, in submission order. Audio
+# decoding stays on the default executor and still runs in parallel.
+_inference_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper-inference")
+
+
+async def run_transcription(model, audio_data: np.ndarray, sample_rate: int) -> str:
+    """Transcribe on the inference thread without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_inference_executor, model.transcribe, audio_data, sample_rate)
+
+
+class ModelSizeMismatch(ValueError):
+    """A model size other than the loaded one was requested."""
+
+
 app = FastAPI(title="Whisper Transcription API", version="1.0.0")
 
 # Enable CORS for frontend integration
@@ -85,69 +171,501 @@ app.add_middleware(
 
 
 def initialize_whisper_model(
-    encoder_path: str = "build\\whisper_base_float\\precompiled\\qualcomm-snapdragon-x-elite\\HfWhisperEncoder\\model.onnx",
-    decoder_path: str = "build\\whisper_base_float\\precompiled\\qualcomm-snapdragon-x-elite\\HfWhisperDecoder\\model.onnx",
-    model_size: str = "base"
+    encoder_path: Optional[str] = None,
+    decoder_path: Optional[str] = None,
+    model_size: Optional[str] = None
 ):
-    """Initialize the Whisper model."""
-    global whisper_app
+    """
+    Initialize the Whisper model once per process.
+    Arguments left as None fall back to the server's configured model.
+    
+    The model is never reloaded: NPU session setup is expensive, so asking for
+    a different model size than the one already loaded is an error.
+    """
+    global whisper_app, whisper_model_size
+    
+    encoder_path = encoder_path or ENCODER_PATH
+    decoder_path = decoder_path or DECODER_PATH
+    model_size = model_size or MODEL_SIZE
     
     if whisper_app is None:
-        print(f"Loading Whisper model ({model_size})...")
-        whisper_app = HfWhisperApp(
-            OnnxModelTorchWrapper.OnNPU(encoder_path),
-            OnnxModelTorchWrapper.OnNPU(decoder_path),
-            f"openai/whisper-{model_size}",
+        with _model_lock:
+            if whisper_app is None:
+                print(f"Loading Whisper model ({model_size})...")
+                loaded_app = HfWhisperApp(
+                    OnnxModelTorchWrapper.OnNPU(encoder_path),
+                    OnnxModelTorchWrapper.OnNPU(decoder_path),
+                    f"openai/whisper-{model_size}",
+                )
+                # Publish the size before the app so lock-free readers never
+                # see a loaded app without its size
+                whisper_model_size = model_size
+                whisper_app = loaded_app
+                print("✅ Model loaded successfully")
+    
+    if model_size != whisper_model_size:
+        raise ModelSizeMismatch(
+            f"Model size '{model_size}' requested, but whisper-{whisper_model_size} is already loaded"
         )
-        print("✅ Model loaded successfully")
     
     return whisper_app
 
 
+def _sniff_input_format(audio_data: bytes) -> Optional[str]:
+    """
+    Identify the container from its magic bytes, as an ffmpeg demuxer name.
+    The client-supplied format is not trusted for this: the frontend labels
+    WAV data with the recorder's MIME type (e.g. audio/webm).
+    
+    Returns:
+        Demuxer name, or None to let ffmpeg probe the input itself
+    """
+    head = bytes(audio_data[:12])
+    if head[:4] == b'RIFF' and head[8:12] == b'WAVE':
+        return "wav"
+    if head[:4] == b'\x1a\x45\xdf\xa3':  # EBML header
+        return "webm"
+    if head[:4] == b'OggS':
+        return "ogg"
+    # MPEG audio frame sync; a zero layer field is ADTS AAC, left to ffmpeg's probe
+    if head[:3] == b'ID3' or (
+        len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0 and (head[1] >> 1) & 0x3
+    ):
+        return "mp3"
+    return None
+
+
+def _finalize_piped_wav(wav_data: bytes) -> bytes:
+    """
+    Fill in the RIFF and data chunk sizes of WAV written to a pipe.
+    ffmpeg can't seek back to patch the header, so it leaves placeholders.
+    """
+    wav = bytearray(wav_data)
+    if len(wav) < 12 or wav[:4] != b'RIFF':
+        return wav_data
+    
+    struct.pack_into('<I', wav, 4, len(wav) - 8)
+    offset = 12
+    while offset + 8 <= len(wav):
+        chunk_id, chunk_size = struct.unpack_from('<4sI', wav, offset)
+        if chunk_id == b'data':
+            struct.pack_into('<I', wav, offset + 4, len(wav) - offset - 8)
+            break
+        offset += 8 + chunk_size + (chunk_size & 1)
+    return bytes(wav)
+
+
 def convert_audio_to_wav_bytes(audio_data: bytes, input_format: str = "webm") -> bytes:
-    """Convert audio data to WAV format using ffmpeg."""
-    ffmpeg_binary = os.environ.get("FFMPEG_BINARY") or shutil.which("ffmpeg")
-    if not ffmpeg_binary:
+    """
+    Convert audio data to 16kHz mono PCM WAV using ffmpeg.
+    The audio is piped through ffmpeg's stdin/stdout, without temp files.
+    """
+    if not _FFMPEG:
         raise Exception("FFmpeg not found")
     
-    # Create temporary files
-    import tempfile
-    with tempfile.NamedTemporaryFile(suffix=f'.{input_format}', delete=False) as tmp_input:
-        tmp_input_path = tmp_input.name
-        tmp_input.write(audio_data)
+    # Convert to WAV using ffmpeg. Naming the demuxer skips format probing,
+    # and a single decoder thread beats thread setup for short mono clips.
+    demuxer = _sniff_input_format(audio_data)
+    cmd = [
+        _FFMPEG,
+        "-hide_banner",
+        "-loglevel", "error",
+        "-threads", "1",
+        *(("-f", demuxer) if demuxer else ()),
+        "-i", "pipe:0",
+        "-ar", "16000",          # 16kHz sample rate
+        "-ac", "1",              # Mono
+        "-acodec", "pcm_s16le",  # PCM 16-bit signed little-endian
+        "-f", "wav",
+        "pipe:1"
+    ]
+    
+    result = subprocess.run(cmd, input=audio_data, capture_output=True, timeout=30)
+    
+    if result.returncode != 0:
+        raise Exception(f"FFmpeg conversion failed: {result.stderr.decode(errors='replace')}")
+    
+    return _finalize_piped_wav(result.stdout)
+
+
+def _decode_to_float32(source) -> tuple[np.ndarray, int]:
+    """
+    Decode any libav-supported audio to 16kHz mono float32 samples in-process.
+    
+    Args:
+        source: Encoded audio data (WebM, MP3, WAV, etc.) as bytes or a
+            readable binary file object
+    
+    Returns:
+        Tuple of (audio_data, sample_rate)
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    
+    resampler = av.AudioResampler(format="flt", layout="mono", rate=TARGET_SAMPLE_RATE)
+    chunks = []
+    with av.open(source) as container:
+        for frame in container.decode(audio=0):
+            for resampled in resampler.resample(frame):
+                chunks.append(resampled.to_ndarray())
+        # Flush samples still buffered in the resampler
+        for resampled in resampler.resample(None):
+            chunks.append(resampled.to_ndarray())
+    
+    if not chunks:
+        return np.zeros(0, dtype=np.float32), TARGET_SAMPLE_RATE
+    return np.concatenate(chunks, axis=None), TARGET_SAMPLE_RATE
+
+
+# Recently decoded audio, keyed by a digest of the encoded input, so replayed
+# uploads (test runs, retries) skip decoding. Cached arrays are shared between
+# requests and must not be modified. The decoded arrays are much larger than
+# the encoded inputs, so the cache is bounded by their total size as well as
+# by entry count; this budget applies to each server worker separately.
+_DECODE_CACHE_SIZE = 32
+_DECODE_CACHE_MAX_BYTES = 50 * 1024 * 1024        # largest encoded input that is hashed
+_DECODE_CACHE_BUDGET_BYTES = 256 * 1024 * 1024    # total decoded samples held
+_DECODE_CACHE_MAX_ENTRY_BYTES = 32 * 1024 * 1024  # ~8.7 min of 16kHz float32
+_decode_cache: "OrderedDict[bytes, tuple[np.ndarray, int]]" = OrderedDict()
+_decode_cache_bytes = 0
+_decode_cache_lock = threading.Lock()
+
+
+def _decode_cache_get(key: bytes) -> Optional[tuple[np.ndarray, int]]:
+    with _decode_cache_lock:
+        decoded = _decode_cache.get(key)
+        if decoded is not None:
+            _decode_cache.move_to_end(key)
+        return decoded
+
+
+def _decode_cache_put(key: bytes, decoded: tuple[np.ndarray, int]):
+    global _decode_cache_bytes
+    nbytes = decoded[0].nbytes
+    if nbytes > _DECODE_CACHE_MAX_ENTRY_BYTES:
+        return
+    with _decode_cache_lock:
+        previous = _decode_cache.pop(key, None)
+        if previous is not None:
+            _decode_cache_bytes -= previous[0].nbytes
+        _decode_cache[key] = decoded
+        _decode_cache_bytes += nbytes
+        while len(_decode_cache) > _DECODE_CACHE_SIZE or _decode_cache_bytes > _DECODE_CACHE_BUDGET_BYTES:
+            _, evicted = _decode_cache.popitem(last=False)
+            _decode_cache_bytes -= evicted[0].nbytes
+
+
+def _decode_audio_bytes_uncached(audio_bytes: bytes, input_format: str) -> tuple[np.ndarray, int]:
+    # WAV that is already 16kHz mono PCM needs no decoder. The content is
+    # checked rather than the format hint, which clients often get wrong.
+    if _is_target_pcm(audio_bytes):
+        parsed = _parse_wav_fast(audio_bytes)
+        if parsed is not None:
+            return parsed
     
-    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_output:
-        tmp_output_path = tmp_output.name
+    if av is not None:
+        return _decode_to_float32(audio_bytes)
     
+    wav_bytes = convert_audio_to_wav_bytes(audio_bytes, input_format)
+    return load_audio_from_bytes(wav_bytes)
+
+
+def decode_audio_bytes(audio_bytes: bytes, input_format: str = "webm") -> tuple[np.ndarray, int]:
+    """
+    Decode audio of any supported format to 16kHz mono float32 samples.
+    Uses PyAV when available, otherwise converts through the ffmpeg binary.
+    Results for recently seen inputs are served from an LRU cache.
+    
+    Args:
+        audio_bytes: Encoded audio data
+        input_format: Format hint (file extension) for the ffmpeg fallback
+    
+    Returns:
+        Tuple of (audio_data, sample_rate)
+    """
+    if len(audio_bytes) > _DECODE_CACHE_MAX_BYTES:
+        return _decode_audio_bytes_uncached(audio_bytes, input_format)
+    
+    key = hashlib.blake2b(audio_bytes, digest_size=16).digest()
+    decoded = _decode_cache_get(key)
+    if decoded is None:
+        decoded = _decode_audio_bytes_uncached(audio_bytes, input_format)
+        _decode_cache_put(key, decoded)
+    return decoded
+
+
+# Per-thread scratch buffer for raw PCM read back from ffmpeg; it only grows
+_pcm_local = threading.local()
+
+
+def _read_pcm_pooled(stream) -> memoryview:
+    """
+    Read a pipe to EOF into this thread's reusable buffer.
+    The returned view is only valid until the next call on the same thread.
+    """
+    buf = getattr(_pcm_local, "buf", None) or bytearray(1024 * 1024)
+    filled = 0
+    while True:
+        if filled == len(buf):
+            grown = bytearray(len(buf) * 2)
+            grown[:filled] = buf
+            buf = grown
+        n = stream.readinto(memoryview(buf)[filled:])
+        if not n:
+            break
+        filled += n
+    _pcm_local.buf = buf
+    return memoryview(buf)[:filled]
+
+
+def _ffmpeg_decode_stream(fileobj, timeout: float = 30) -> tuple[np.ndarray, int]:
+    """
+    Decode audio from a file object by piping it through ffmpeg.
+    The input is fed to ffmpeg's stdin from a helper thread while raw 16kHz
+    mono PCM is read back from stdout, so the input is never held in memory.
+    
+    Args:
+        fileobj: Readable binary file object with encoded audio
+        timeout: Seconds before ffmpeg is killed
+    
+    Returns:
+        Tuple of (audio_data, sample_rate)
+    """
+    if not _FFMPEG:
+        raise Exception("FFmpeg not found")
+    
+    cmd = [
+        _FFMPEG,
+        "-hide_banner",
+        "-loglevel", "error",
+        "-i", "pipe:0",
+        "-ar", str(TARGET_SAMPLE_RATE),  # 16kHz sample rate
+        "-ac", "1",                      # Mono
+        "-acodec", "pcm_s16le",          # PCM 16-bit signed little-endian
+        "-f", "s16le",
+        "pipe:1"
+    ]
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    
+    def feed_stdin():
+        try:
+            shutil.copyfileobj(fileobj, proc.stdin, 64 * 1024)
+            proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass  # ffmpeg exited early; its stderr says why
+    
+    # Corrupt inputs can log an error per packet, so stderr is drained on its
+    # own thread (keeping only the tail) to stop a full pipe stalling ffmpeg
+    stderr_tail = deque(maxlen=20)
+    
+    def drain_stderr():
+        for line in proc.stderr:
+            stderr_tail.append(line.decode(errors='replace').rstrip())
+    
+    timed_out = threading.Event()
+    
+    def kill():
+        timed_out.set()
+        proc.kill()
+    
+    feeder = threading.Thread(target=feed_stdin, daemon=True)
+    stderr_thread = threading.Thread(target=drain_stderr, daemon=True)
+    watchdog = threading.Timer(timeout, kill)
+    feeder.start()
+    stderr_thread.start()
+    watchdog.start()
     try:
-        # Convert to WAV using ffmpeg
-        cmd = [
-            ffmpeg_binary,
-            "-i", tmp_input_path,
-            "-ar", "16000",  # 16kHz sample rate
-            "-ac", "1",      # Mono
-            "-f", "wav",
-            "-y",
-            tmp_output_path
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        
-        if result.returncode != 0:
-            raise Exception(f"FFmpeg conversion failed: {result.stderr}")
+        pcm = _read_pcm_pooled(proc.stdout)
+        proc.wait()
+    finally:
+        watchdog.cancel()
+        if proc.poll() is None:
+            proc.kill()  # reading stdout failed; don't leave the helper threads blocked
+        feeder.join()
+        stderr_thread.join()
+    
+    if timed_out.is_set():
+        raise Exception(f"FFmpeg conversion timed out after {timeout}s: " + "\n".join(stderr_tail))
+    if proc.returncode != 0:
+        raise Exception("FFmpeg conversion failed: " + "\n".join(stderr_tail))
+    
+    # The float32 result is a fresh array, so nothing returned aliases the pool
+    samples = np.frombuffer(pcm, dtype=np.int16, count=len(pcm) // 2)
+    return _pcm_to_float32(samples), TARGET_SAMPLE_RATE
+
+
+def decode_audio_stream(fileobj) -> tuple[np.ndarray, int]:
+    """
+    Decode audio from a file object to 16kHz mono float32 samples without
+    reading the whole input into memory first.
+    Uses PyAV when available, otherwise pipes the input through ffmpeg.
+    Results for recently seen inputs are served from an LRU cache.
+    
+    Args:
+        fileobj: Readable, seekable binary file object with encoded audio
+    
+    Returns:
+        Tuple of (audio_data, sample_rate)
+    """
+    # Hash the input in chunks for the decode cache, then rewind for decoding
+    key = None
+    fileobj.seek(0, os.SEEK_END)
+    if fileobj.tell() <= _DECODE_CACHE_MAX_BYTES:
+        fileobj.seek(0)
+        hasher = hashlib.blake2b(digest_size=16)
+        while chunk := fileobj.read(64 * 1024):
+            hasher.update(chunk)
+        key = hasher.digest()
+        decoded = _decode_cache_get(key)
+        if decoded is not None:
+            return decoded
+    fileobj.seek(0)
+    
+    # Same short-circuit as decode_audio_bytes for 16kHz mono PCM WAV
+    decoded = None
+    if _is_target_pcm(fileobj.read(4096)):
+        fileobj.seek(0)
+        decoded = _parse_wav_fast(fileobj.read())
+    
+    if decoded is None:
+        fileobj.seek(0)
+        if av is not None:
+            decoded = _decode_to_float32(fileobj)
+        else:
+            decoded = _ffmpeg_decode_stream(fileobj)
+    
+    if key is not None:
+        _decode_cache_put(key, decoded)
+    return decoded
+
+
+# Base64 is decoded in slices of this many characters (a multiple of 4, so
+# every slice decodes on its own) into a per-thread reusable buffer
+_B64_DECODE_CHUNK = 64 * 1024
+_b64_local = threading.local()
+
+
+def _b64decode_pooled(b64_audio: str) -> memoryview:
+    """
+    Decode base64 into this thread's reusable buffer instead of a fresh bytes
+    object. The returned view is only valid until the next call on the same
+    thread, so decode it to samples before returning to the caller.
+    """
+    needed = len(b64_audio) * 3 // 4
+    buf = getattr(_b64_local, "buf", None)
+    if buf is None or len(buf) < needed:
+        buf = _b64_local.buf = bytearray(needed)
+    
+    n = 0
+    try:
+        for start in range(0, len(b64_audio), _B64_DECODE_CHUNK):
+            decoded = binascii.a2b_base64(b64_audio[start:start + _B64_DECODE_CHUNK])
+            buf[n:n + len(decoded)] = decoded
+            n += len(decoded)
+    except binascii.Error:
+        # Embedded whitespace misaligns the slices; decode it in one go
+        return memoryview(base64.b64decode(b64_audio))
+    return memoryview(buf)[:n]
+
+
+def decode_base64_audio(b64_audio: str, input_format: str = "webm") -> tuple[np.ndarray, int]:
+    """
+    Decode base64-encoded audio to 16kHz mono float32 samples.
+    Runs the base64 step and the audio decode on the same thread, which
+    keeps the pooled base64 buffer private to this call.
+    
+    Args:
+        b64_audio: Base64 encoded audio data
+        input_format: Format hint (file extension) for the ffmpeg fallback
+    
+    Returns:
+        Tuple of (audio_data, sample_rate)
+    """
+    return decode_audio_bytes(_b64decode_pooled(b64_audio), input_format)
+
+
+# WAV format tags that the scipy/wave loaders can read without ffmpeg
+_WAVE_FORMAT_PCM = 1
+_WAVE_FORMAT_IEEE_FLOAT = 3
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE  # 24-bit and multichannel PCM; scipy reads these
+_LOADABLE_WAV_FORMATS = (_WAVE_FORMAT_PCM, _WAVE_FORMAT_IEEE_FLOAT, _WAVE_FORMAT_EXTENSIBLE)
+
+
+def _read_wav_fmt(audio_bytes: bytes) -> Optional[tuple[int, int, int, int]]:
+    """
+    Read a WAV header's fmt chunk without touching the sample data.
+    
+    Returns:
+        Tuple of (format_tag, channels, sample_rate, bits_per_sample), or
+        None if the data is not a WAV file
+    """
+    if len(audio_bytes) < 12 or audio_bytes[:4] != b'RIFF' or audio_bytes[8:12] != b'WAVE':
+        return None
+    
+    offset = 12
+    while offset + 24 <= len(audio_bytes):
+        chunk_id, chunk_size = struct.unpack_from('<4sI', audio_bytes, offset)
+        if chunk_id == b'fmt ':
+            format_tag, channels, sample_rate, _, _, bits = struct.unpack_from('<HHIIHH', audio_bytes, offset + 8)
+            return format_tag, channels, sample_rate, bits
+        if chunk_id == b'data':
+            return None
+        offset += 8 + chunk_size + (chunk_size & 1)
+    return None
+
+
+def _sniff_wav_format(audio_bytes: bytes) -> Optional[int]:
+    """Return the WAV format tag, or None if the data is not a WAV file."""
+    fmt = _read_wav_fmt(audio_bytes)
+    return fmt[0] if fmt is not None else None
+
+
+def _is_target_pcm(audio_bytes: bytes) -> bool:
+    """Check whether WAV data is already 16kHz mono 16-bit PCM."""
+    return _read_wav_fmt(audio_bytes) == (_WAVE_FORMAT_PCM, 1, TARGET_SAMPLE_RATE, 16)
+
+
+def _parse_wav_fast(audio_bytes: bytes) -> Optional[tuple[np.ndarray, int]]:
+    """
+    Decode 16-bit mono PCM WAV bytes without scipy or the wave module.
+    The samples are read in place from the data chunk; only the float32
+    normalization allocates.
+    
+    Args:
+        audio_bytes: WAV audio data
+    
+    Returns:
+        Tuple of (audio_data, sample_rate), or None if the data is not
+        16-bit mono PCM WAV
+    """
+    if len(audio_bytes) < 12 or audio_bytes[:4] != b'RIFF' or audio_bytes[8:12] != b'WAVE':
+        return None
+    
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(audio_bytes):
+        chunk_id, chunk_size = struct.unpack_from('<4sI', audio_bytes, offset)
+        offset += 8
         
-        # Read the WAV file
-        with open(tmp_output_path, 'rb') as f:
-            wav_data = f.read()
+        if chunk_id == b'fmt ':
+            if chunk_size < 16:
+                return None
+            format_tag, channels, sample_rate, _, _, bits = struct.unpack_from('<HHIIHH', audio_bytes, offset)
+            fmt = (format_tag, channels, sample_rate, bits)
+        elif chunk_id == b'data':
+            if fmt is None:
+                return None
+            format_tag, channels, sample_rate, bits = fmt
+            if format_tag != _WAVE_FORMAT_PCM or channels != 1 or bits != 16:
+                return None
+            # Streamed WAVs may carry a placeholder size, so clamp to what's there
+            count = min(chunk_size, len(audio_bytes) - offset) // 2
+            samples = np.frombuffer(audio_bytes, dtype=np.int16, offset=offset, count=count)
+            return _pcm_to_float32(samples), sample_rate
         
-        return wav_data
+        offset += chunk_size + (chunk_size & 1)  # Chunks are word-aligned
     
-    finally:
-        # Cleanup
-        if os.path.exists(tmp_input_path):
-            os.unlink(tmp_input_path)
-        if os.path.exists(tmp_output_path):
-            os.unlink(tmp_output_path)
+    return None
 
 
 def load_audio_from_bytes(audio_bytes: bytes, force_convert: bool = False) -> tuple[np.ndarray, int]:
@@ -161,63 +679,32 @@ def load_audio_from_bytes(audio_bytes: bytes, force_convert: bool = False) -> tu
     Returns:
         Tuple of (audio_data, sample_rate)
     """
-    # If force_convert is True, use FFmpeg to ensure standard PCM format
+    # If force_convert is True, decode in-process with PyAV when available
+    if force_convert and av is not None:
+        return _decode_to_float32(audio_bytes)
+    
+    # Compressed WAV (DVI_ADPCM, etc.) and non-WAV data go straight to
+    # conversion rather than failing through scipy and wave first
+    if not force_convert and _sniff_wav_format(audio_bytes) not in _LOADABLE_WAV_FORMATS:
+        return load_audio_from_bytes(audio_bytes, force_convert=True)
+    
+    # Otherwise use FFmpeg to ensure standard PCM format
     if force_convert:
-        # Write to temp file and convert with FFmpeg
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_input:
-            tmp_input_path = tmp_input.name
-            tmp_input.write(audio_bytes)
-        
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_output:
-            tmp_output_path = tmp_output.name
-        
-        try:
-            ffmpeg_binary = os.environ.get("FFMPEG_BINARY") or shutil.which("ffmpeg")
-            if not ffmpeg_binary:
-                raise Exception("FFmpeg not found")
-            
-            # Convert to standard PCM WAV
-            cmd = [
-                ffmpeg_binary,
-                "-i", tmp_input_path,
-                "-ar", "16000",  # 16kHz sample rate
-                "-ac", "1",      # Mono
-                "-acodec", "pcm_s16le",  # PCM 16-bit signed little-endian
-                "-f", "wav",
-                "-y",
-                tmp_output_path
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode != 0:
-                raise Exception(f"FFmpeg conversion failed: {result.stderr}")
-            
-            # Read the converted file
-            with open(tmp_output_path, 'rb') as f:
-                audio_bytes = f.read()
-        
-        finally:
-            # Cleanup
-            if os.path.exists(tmp_input_path):
-                os.unlink(tmp_input_path)
-            if os.path.exists(tmp_output_path):
-                os.unlink(tmp_output_path)
+        audio_bytes = convert_audio_to_wav_bytes(audio_bytes, "wav")
+    
+    # Plain 16-bit mono PCM (including our own ffmpeg output) needs no parser
+    parsed = _parse_wav_fast(audio_bytes)
+    if parsed is not None:
+        return parsed
     
     # Try to load with scipy first
     try:
-        from scipy.io import wavfile
+        if _scipy_wavfile is None:
+            raise ImportError("scipy is not installed")
         with io.BytesIO(audio_bytes) as wav_buffer:
-            sample_rate, audio_data = wavfile.read(wav_buffer)
+            sample_rate, audio_data = _scipy_wavfile.read(wav_buffer)
             # Convert to float32 and normalize
-            if audio_data.dtype == np.int16:
-                audio_data = audio_data.astype(np.float32) / 32768.0
-            elif audio_data.dtype == np.int32:
-                audio_data = audio_data.astype(np.float32) / 2147483648.0
-            elif audio_data.dtype == np.uint8:
-                audio_data = (audio_data.astype(np.float32) - 128) / 128.0
-            return audio_data, sample_rate
+            return _pcm_to_float32(audio_data), sample_rate
     except (ImportError, ValueError) as e:
         # If scipy fails or encounters unsupported format, try wave module
         # If that also fails and we haven't tried FFmpeg yet, convert and retry
@@ -227,7 +714,6 @@ def load_audio_from_bytes(audio_bytes: bytes, force_convert: bool = False) -> tu
         
         # Try wave module as fallback
         try:
-            import wave
             with io.BytesIO(audio_bytes) as wav_buffer:
                 with wave.open(wav_buffer, 'rb') as wav_file:
                     sample_rate = wav_file.getframerate()
@@ -235,15 +721,15 @@ def load_audio_from_bytes(audio_bytes: bytes, force_convert: bool = False) -> tu
                     sample_width = wav_file.getsampwidth()
                     
                     if sample_width == 2:  # 16-bit
-                        audio_data = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+                        pcm_dtype = np.int16
                     elif sample_width == 1:  # 8-bit
-                        audio_data = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128.0
+                        pcm_dtype = np.uint8
                     elif sample_width == 4:  # 32-bit
-                        audio_data = np.frombuffer(frames, dtype=np.int32).astype(np.float32) / 2147483648.0
+                        pcm_dtype = np.int32
                     else:
                         raise ValueError(f"Unsupported sample width: {sample_width}")
                     
-                    return audio_data, sample_rate
+                    return _pcm_to_float32(np.frombuffer(frames, dtype=pcm_dtype)), sample_rate
         except Exception as wave_error:
             if not force_convert:
                 print(f"⚠️  Standard WAV loading failed, converting with FFmpeg...")
@@ -252,6 +738,36 @@ def load_audio_from_bytes(audio_bytes: bytes, force_convert: bool = False) -> tu
                 raise Exception(f"Failed to load audio: {str(e)}, {str(wave_error)}")
 
 
+def _load_wav_file_as_float32(file_path: str) -> tuple[np.ndarray, int]:
+    """
+    Load a WAV file from disk as 16kHz mono float32 samples in a single decode.
+    Compressed WAV formats (DVI_ADPCM, etc.) are handled by the decoder.
+    
+    Args:
+        file_path: Path to the WAV file
+        
+    Returns:
+        Tuple of (audio_data, sample_rate)
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Audio file not found: {file_path}")
+    
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return decode_audio_bytes(b"", "wav")
+        
+        # Map the file instead of reading it, so PCM samples are parsed
+        # straight from the page cache without an intermediate bytes copy
+        wav_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return decode_audio_bytes(memoryview(wav_map), "wav")
+        finally:
+            try:
+                wav_map.close()
+            except BufferError:
+                pass  # A traceback still holds a view; unmapped once it's freed
+
+
 def wav_file_to_blob_data(file_path: str) -> AudioBlobData:
     """
     Convert a WAV file path to blob-like data structure similar to JavaScript.
@@ -280,54 +796,14 @@ def wav_file_to_blob_data(file_path: str) -> AudioBlobData:
         
         # After successful load, get the converted WAV bytes if conversion happened
         # For blob data, we should use standard PCM format
-        # Re-encode as standard PCM WAV for consistency
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-            tmp_wav_path = tmp_file.name
-        
-        try:
-            # Convert to standard PCM using FFmpeg
-            ffmpeg_binary = os.environ.get("FFMPEG_BINARY") or shutil.which("ffmpeg")
-            if ffmpeg_binary:
-                # Write original to temp file
-                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_input:
-                    tmp_input_path = tmp_input.name
-                    tmp_input.write(original_wav_bytes)
-                
-                # Convert to standard PCM
-                cmd = [
-                    ffmpeg_binary,
-                    "-i", tmp_input_path,
-                    "-ar", "16000",
-                    "-ac", "1",
-                    "-acodec", "pcm_s16le",
-                    "-f", "wav",
-                    "-y",
-                    tmp_wav_path
-                ]
-                
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                
-                if result.returncode == 0:
-                    # Read converted PCM WAV
-                    with open(tmp_wav_path, 'rb') as f:
-                        wav_bytes = f.read()
-                    wav_size = len(wav_bytes)
-                else:
-                    # Fallback to original
-                    wav_bytes = original_wav_bytes
-                    wav_size = original_file_size
-                
-                # Cleanup
-                if os.path.exists(tmp_input_path):
-                    os.unlink(tmp_input_path)
-            else:
-                wav_bytes = original_wav_bytes
-                wav_size = original_file_size
-        
-        finally:
-            if os.path.exists(tmp_wav_path):
-                os.unlink(tmp_wav_path)
+        # Re-encode as standard PCM WAV for consistency, unless it already is
+        wav_bytes = original_wav_bytes
+        if _FFMPEG and not _is_target_pcm(original_wav_bytes):
+            try:
+                wav_bytes = convert_audio_to_wav_bytes(original_wav_bytes, "wav")
+            except Exception:
+                pass  # Fallback to original
+        wav_size = len(wav_bytes)
     
     except Exception as e:
         raise Exception(f"Failed to process WAV file: {str(e)}")
@@ -350,6 +826,9 @@ def wav_file_to_blob_data(file_path: str) -> AudioBlobData:
 @app.on_event("startup")
 async def startup_event():
     """Initialize model on startup."""
+    if not _FFMPEG and av is None:
+        print("[WARNING] Neither FFmpeg nor PyAV was found; only plain PCM WAV audio can be decoded.")
+    
     try:
         initialize_whisper_model()
     except Exception as e:
@@ -366,6 +845,8 @@ async def root():
         "endpoints": {
             "POST /transcribe": "Transcribe audio from uploaded file (supports WebM, MP3, WAV, etc.)",
             "POST /transcribe-blob": "Transcribe audio from base64 encoded blob data",
+            "POST /transcribe-blob-binary": "Transcribe raw audio bytes sent as the request body",
+            "POST /transcribe-batch": "Transcribe a list of base64 encoded blobs",
             "POST /transcribe-file-path": "Transcribe audio from file path",
             "GET /health": "Health check endpoint"
         }
@@ -385,40 +866,42 @@ async def health_check():
 @app.post("/transcribe", response_model=TranscriptionResponse)
 async def transcribe_audio(
     audio_file: UploadFile = File(...),
-    model_size: str = Form("base")
+    model_size: Optional[str] = Form(None)
 ):
     """
     Transcribe audio from uploaded file.
     
     Args:
         audio_file: Audio file (WebM, MP3, WAV, etc.)
-        model_size: Whisper model size (tiny, base, small, medium, large)
+        model_size: Whisper model size (tiny, base, small, medium, large);
+            defaults to the size the server loaded
         
     Returns:
         TranscriptionResponse with transcription and metadata
     """
+    # The server runs a single model, so another size is a client error
+    try:
+        model = await asyncio.to_thread(initialize_whisper_model, model_size=model_size)
+    except ModelSizeMismatch as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
+    
     try:
-        # Initialize model if needed
-        model = initialize_whisper_model(model_size=model_size)
-        
-        # Read uploaded file
-        audio_bytes = await audio_file.read()
-        
         # Detect file format from filename or content type
         file_extension = audio_file.filename.split('.')[-1].lower() if audio_file.filename else "wav"
         
-        # Always convert through FFmpeg to ensure standard PCM format
-        # This handles compressed WAV formats (DVI_ADPCM, etc.) as well
-        print(f"Converting {file_extension} to standard PCM WAV...")
-        wav_bytes = convert_audio_to_wav_bytes(audio_bytes, file_extension)
-        
-        # Load audio (should work now that it's in PCM format)
-        audio_data, sample_rate = load_audio_from_bytes(wav_bytes)
+        # Always decode through libav/FFmpeg to get standard PCM samples
+        # This handles compressed WAV formats (DVI_ADPCM, etc.) as well.
+        # The upload is streamed from its spooled file rather than read into
+        # a bytes copy first.
+        print(f"Decoding {file_extension} audio...")
+        audio_data, sample_rate = await asyncio.to_thread(decode_audio_stream, audio_file.file)
         
         # Transcribe
-        start_time = datetime.now()
-        transcription = model.transcribe(audio_data, sample_rate)
-        processing_time = (datetime.now() - start_time).total_seconds()
+        start_time = time.perf_counter()
+        transcription = await run_transcription(model, audio_data, sample_rate)
+        processing_time = time.perf_counter() - start_time
         
         return TranscriptionResponse(
             transcription=transcription,
@@ -445,29 +928,78 @@ async def transcribe_from_blob(blob_data: AudioBlobData):
     """
     try:
         # Initialize model if needed
-        model = initialize_whisper_model()
+        model = await asyncio.to_thread(initialize_whisper_model)
         
-        # Decode base64 audio data
+        # Pick the base64 audio data
         if blob_data.wavBlob:
-            audio_bytes = base64.b64decode(blob_data.wavBlob)
+            b64_audio = blob_data.wavBlob
         elif blob_data.blob:
-            audio_bytes = base64.b64decode(blob_data.blob)
+            b64_audio = blob_data.blob
         else:
             raise HTTPException(status_code=400, detail="No audio data provided")
         
-        # Always convert through FFmpeg to ensure standard PCM format
+        # Always decode through libav/FFmpeg to get standard PCM samples
         # This handles all formats including compressed WAV (DVI_ADPCM, etc.)
         format_type = blob_data.mimeType.split('/')[-1] if '/' in blob_data.mimeType else "wav"
-        print(f"Converting {format_type} to standard PCM WAV...")
-        wav_bytes = convert_audio_to_wav_bytes(audio_bytes, format_type)
+        print(f"Decoding {format_type} audio...")
+        audio_data, sample_rate = await asyncio.to_thread(decode_base64_audio, b64_audio, format_type)
+        
+        # Transcribe
+        start_time = time.perf_counter()
+        transcription = await run_transcription(model, audio_data, sample_rate)
+        processing_time = time.perf_counter() - start_time
+        
+        return TranscriptionResponse(
+            transcription=transcription,
+            duration=processing_time,
+            timestamp=datetime.now().isoformat(),
+            sample_rate=sample_rate,
+            samples=len(audio_data)
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
+
+
+@app.post("/transcribe-blob-binary", response_model=TranscriptionResponse)
+async def transcribe_from_binary_blob(
+    request: Request,
+    x_mime_type: str = Header("audio/wav")
+):
+    """
+    Transcribe raw audio bytes sent as the request body (application/octet-stream).
+    Same as /transcribe-blob, but without the base64 encoding overhead.
+    
+    Args:
+        request: Request whose body is the raw audio data
+        x_mime_type: MIME type of the audio, from the X-Mime-Type header
+        
+    Returns:
+        TranscriptionResponse with transcription and metadata
+    """
+    try:
+        # Initialize model if needed
+        model = await asyncio.to_thread(initialize_whisper_model)
+        
+        # Collect the body as it arrives
+        audio_bytes = bytearray()
+        async for chunk in request.stream():
+            audio_bytes.extend(chunk)
+        
+        if not audio_bytes:
+            raise HTTPException(status_code=400, detail="No audio data provided")
         
-        # Load audio (should work now that it's in PCM format)
-        audio_data, sample_rate = load_audio_from_bytes(wav_bytes)
+        # Always decode through libav/FFmpeg to get standard PCM samples
+        format_type = x_mime_type.split('/')[-1] if '/' in x_mime_type else "wav"
+        print(f"Decoding {format_type} audio...")
+        audio_data, sample_rate = await asyncio.to_thread(decode_audio_bytes, audio_bytes, format_type)
         
         # Transcribe
-        start_time = datetime.now()
-        transcription = model.transcribe(audio_data, sample_rate)
-        processing_time = (datetime.now() - start_time).total_seconds()
+        start_time = time.perf_counter()
+        transcription = await run_transcription(model, audio_data, sample_rate)
+        processing_time = time.perf_counter() - start_time
         
         return TranscriptionResponse(
             transcription=transcription,
@@ -477,6 +1009,66 @@ async def transcribe_from_blob(blob_data: AudioBlobData):
             samples=len(audio_data)
         )
         
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
+
+
+@app.post("/transcribe-batch", response_model=List[TranscriptionResponse])
+async def transcribe_batch(blobs: List[AudioBlobData]):
+    """
+    Transcribe several base64 blobs (same structure as /transcribe-blob) in one request.
+    
+    All clips are decoded concurrently up front, and each clip is transcribed
+    as soon as its decode finishes, so decoding overlaps with transcription.
+    
+    Args:
+        blobs: List of AudioBlobData objects with base64 encoded audio
+        
+    Returns:
+        List of TranscriptionResponse, in the same order as the input
+    """
+    for index, blob_data in enumerate(blobs):
+        if not (blob_data.wavBlob or blob_data.blob):
+            raise HTTPException(status_code=400, detail=f"No audio data provided for item {index}")
+    
+    try:
+        # Initialize model if needed
+        model = await asyncio.to_thread(initialize_whisper_model)
+        
+        decode_tasks = [
+            asyncio.create_task(asyncio.to_thread(
+                decode_base64_audio,
+                blob_data.wavBlob or blob_data.blob,
+                blob_data.mimeType.split('/')[-1] if '/' in blob_data.mimeType else "wav",
+            ))
+            for blob_data in blobs
+        ]
+        
+        results = []
+        try:
+            for decode_task in decode_tasks:
+                audio_data, sample_rate = await decode_task
+                
+                # Transcribe
+                start_time = time.perf_counter()
+                transcription = await run_transcription(model, audio_data, sample_rate)
+                processing_time = time.perf_counter() - start_time
+                
+                results.append(TranscriptionResponse(
+                    transcription=transcription,
+                    duration=processing_time,
+                    timestamp=datetime.now().isoformat(),
+                    sample_rate=sample_rate,
+                    samples=len(audio_data)
+                ))
+        finally:
+            for decode_task in decode_tasks:
+                decode_task.cancel()
+        
+        return results
+        
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
 
@@ -499,19 +1091,15 @@ async def transcribe_from_file_path(request: FilePathRequest):
             raise HTTPException(status_code=404, detail=f"File not found: {file_path}")
         
         # Initialize model if needed
-        model = initialize_whisper_model()
+        model = await asyncio.to_thread(initialize_whisper_model)
         
-        # Convert file to blob data
-        blob_data = wav_file_to_blob_data(file_path)
-        
-        # Decode and load audio
-        audio_bytes = base64.b64decode(blob_data.wavBlob)
-        audio_data, sample_rate = load_audio_from_bytes(audio_bytes)
+        # Decode the file straight to samples (no blob/base64 round-trip)
+        audio_data, sample_rate = await asyncio.to_thread(_load_wav_file_as_float32, file_path)
         
         # Transcribe
-        start_time = datetime.now()
-        transcription = model.transcribe(audio_data, sample_rate)
-        processing_time = (datetime.now() - start_time).total_seconds()
+        start_time = time.perf_counter()
+        transcription = await run_transcription(model, audio_data, sample_rate)
+        processing_time = time.perf_counter() - start_time
         
         return TranscriptionResponse(
             transcription=transcription,
@@ -539,7 +1127,7 @@ async def convert_file_to_blob(request: FilePathRequest) -> AudioBlobData:
         AudioBlobData object
     """
     try:
-        return wav_file_to_blob_data(request.file_path)
+        return await asyncio.to_thread(wav_file_to_blob_data, request.file_path)
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -553,22 +1141,28 @@ if __name__ == "__main__":
     parser.add_argument("--host", type=str, default="0.0.0.0", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload for development")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WEB_CONCURRENCY", 1)),
+        help="Number of server processes; each loads its own copy of the model (ignored with --reload)"
+    )
     parser.add_argument(
         "--encoder-path",
         type=str,
-        default="build\\whisper_base_float\\precompiled\\qualcomm-snapdragon-x-elite\\HfWhisperEncoder\\model.onnx",
+        default=ENCODER_PATH,
         help="Encoder model path"
     )
     parser.add_argument(
         "--decoder-path",
         type=str,
-        default="build\\whisper_base_float\\precompiled\\qualcomm-snapdragon-x-elite\\HfWhisperDecoder\\model.onnx",
+        default=DECODER_PATH,
         help="Decoder model path"
     )
     parser.add_argument(
         "--model-size",
         type=str,
-        default="base",
+        default=MODEL_SIZE,
         choices=["tiny", "base", "small", "medium", "large", "large-v3-turbo"],
         help="Whisper model size"
     )
@@ -580,6 +1174,7 @@ if __name__ == "__main__":
     print("="*60)
     print(f"Host: {args.host}")
     print(f"Port: {args.port}")
+    print(f"Workers: {args.workers}")
     print(f"Model: whisper-{args.model_size}")
     print(f"Encoder: {args.encoder_path}")
     print(f"Decoder: {args.decoder_path}")
@@ -587,9 +1182,16 @@ if __name__ == "__main__":
     print(f"\nAPI Documentation: http://{args.host}:{args.port}/docs")
     print(f"Interactive API: http://{args.host}:{args.port}/redoc\n")
     
+    # uvicorn imports the app anew in each worker, so the model settings are
+    # handed over through the environment rather than module globals
+    os.environ["WHISPER_MODEL_SIZE"] = args.model_size
+    os.environ["WHISPER_ENCODER_PATH"] = args.encoder_path
+    os.environ["WHISPER_DECODER_PATH"] = args.decoder_path
+    
     uvicorn.run(
         "demo_api:app",
         host=args.host,
         port=args.port,
-        reload=args.reload
+        reload=args.reload,
+        workers=args.workers
     )
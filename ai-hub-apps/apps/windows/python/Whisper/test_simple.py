@@ -30,7 +30,6 @@ try:
     # Prepare payload (matching AudioBlobData structure)
     payload = {
         "blob": wav_base64,
-        "wavBlob": wav_base64,
         "mimeType": "audio/wav",
         "size": len(wav_bytes),
         "wavSize": len(wav_bytes),
@@ -6,11 +6,30 @@ handling CORS and providing a clean REST API.
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-import requests
+import httpx
+import json
+import os
 import uvicorn
 
-app = FastAPI(title="Insight Loop Chat API")
+try:
+    # Much faster than the stdlib json module for request/response bodies
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON response class used for every endpoint
+ResponseClass = ORJSONResponse if orjson is not None else JSONResponse
+
+app = FastAPI(
+    title="Insight Loop Chat API",
+    default_response_class=ResponseClass
+)
+
+# Compress JSON responses large enough to benefit (AI text plus slide preview)
+app.add_middleware(GZipMiddleware, minimum_size=512)
 
 # Enable CORS for frontend communication
 app.add_middleware(
@@ -26,6 +45,14 @@ NEXA_URL = "http://127.0.0.1:18181/v1/chat/completions"
 NEXA_API_KEY = "nexa"
 NEXA_MODEL = "NexaAI/Llama3.2-3B-NPU-Turbo"
 
+# Server processes; each is a thin proxy, so one per core by default
+WORKERS = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+
+# Shared async client: chats await Nexa without blocking the event loop, and
+# every request reuses the pooled keep-alive connections. Created at startup
+# so each worker process gets its own connection pool.
+client: httpx.AsyncClient = None
+
 class ChatRequest(BaseModel):
     question: str
     slideContent: str
@@ -46,6 +73,48 @@ def safe_ascii(text) -> str:
     except Exception:
         return ""
 
+# Static tutor instructions, sent as the same system message on every request
+# so the Nexa server sees an identical prompt prefix and can reuse it
+TUTOR_SYSTEM_PROMPT = (
+    "You are an AI tutor helping a student understand their learning material. "
+    "Please provide a helpful, educational response based on the slide content "
+    "and the student's question."
+)
+TUTOR_SYSTEM_MESSAGE = {"role": "system", "content": TUTOR_SYSTEM_PROMPT}
+
+def build_prompt(request: ChatRequest) -> str:
+    """Combine the student's question with the current slide content."""
+    return "".join((
+        "Current Slide Content:\n",
+        request.slideContent,
+        "\n\nStudent Question: ",
+        request.question,
+    ))
+
+def nexa_payload(prompt: str, stream: bool) -> dict:
+    """Build the Nexa chat completion request body."""
+    return {
+        "model": NEXA_MODEL,
+        "messages": [
+            TUTOR_SYSTEM_MESSAGE,
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        "max_tokens": 256,
+        "temperature": 0.7,
+        "stream": stream
+    }
+
+def dump_json(data: dict) -> bytes:
+    """Serialize a JSON body, with orjson when available."""
+    return orjson.dumps(data) if orjson is not None else json.dumps(data).encode("utf-8")
+
+def sse_event(data: dict) -> bytes:
+    """Encode one server-sent event."""
+    return b"data: " + dump_json(data) + b"\n\n"
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -56,7 +125,27 @@ async def root():
         "model": NEXA_MODEL
     }
 
-@app.post("/chat", response_model=ChatResponse)
+@app.on_event("startup")
+async def open_client():
+    """Open this worker's pooled connections to Nexa."""
+    global client
+    client = httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        headers={
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {NEXA_API_KEY}",
+        },
+    )
+
+@app.on_event("shutdown")
+async def close_client():
+    """Close the pooled connections to Nexa."""
+    await client.aclose()
+
+# ChatResponse only documents the response; the handler returns a ready
+# response so FastAPI doesn't validate and serialize the body a second time
+@app.post("/chat", responses={200: {"model": ChatResponse}})
 async def chat(request: ChatRequest):
     """
     Handle chat requests from the frontend.
@@ -69,14 +158,7 @@ async def chat(request: ChatRequest):
     """
     try:
         # Prepare the prompt with slide context
-        prompt_with_context = f"""You are an AI tutor helping a student understand their learning material. 
-
-Current Slide Content:
-{request.slideContent}
-
-Student Question: {request.question}
-
-Please provide a helpful, educational response based on the slide content and the student's question."""
+        prompt_with_context = build_prompt(request)
         
         # Debug logging (ASCII-safe to avoid Windows charmap issues)
         print("\n=== CHAT REQUEST ===")
@@ -85,25 +167,9 @@ Please provide a helpful, educational response based on the slide content and th
         print("===================\n")
         
         # Call Nexa API
-        response = requests.post(
+        response = await client.post(
             NEXA_URL,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {NEXA_API_KEY}",
-            },
-            json={
-                "model": NEXA_MODEL,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt_with_context
-                    }
-                ],
-                "max_tokens": 256,
-                "temperature": 0.7,
-                "stream": False
-            },
-            timeout=30
+            content=dump_json(nexa_payload(prompt_with_context, stream=False))
         )
         
         if response.status_code != 200:
@@ -115,7 +181,7 @@ Please provide a helpful, educational response based on the slide content and th
                 detail=f"Nexa API error: {safe_error[:500]}"  # Use safe_error instead of response.text
             )
         
-        data = response.json()
+        data = orjson.loads(response.content) if orjson is not None else json.loads(response.content)
         ai_response = data['choices'][0]['message']['content']
         
         # Debug logging (safe for Windows console - remove emojis)
@@ -126,17 +192,17 @@ Please provide a helpful, educational response based on the slide content and th
             print(f"[OK] AI Response received ({len(ai_response)} chars)")
         print("")
         
-        return ChatResponse(
-            response=ai_response,
-            debug={
+        return ResponseClass({
+            "response": ai_response,
+            "debug": {
                 "question": request.question,
                 "slideContentLength": len(request.slideContent),
                 "slidePreview": safe_ascii(request.slideContent[:100]),
                 "tokensUsed": data.get('usage', {}).get('total_tokens', 0)
             }
-        )
+        })
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"[ERROR] Request Error: {str(e)[:200]}")
         raise HTTPException(
             status_code=503,
@@ -158,11 +224,94 @@ Please provide a helpful, educational response based on the slide content and th
             detail=safe_detail
         )
 
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Handle chat requests from the frontend, streaming the response as it is generated.
+    
+    Args:
+        request: ChatRequest containing question and slideContent
+        
+    Returns:
+        Server-sent events: {"token": "..."} per chunk of text, then [DONE]
+    """
+    print("\n=== CHAT STREAM REQUEST ===")
+    print(f"Question: {safe_ascii(request.question)}")
+    print(f"Slide Content: {safe_ascii(request.slideContent[:100])}...")
+    print("===================\n")
+    
+    # Open the upstream stream first so connection and status errors can
+    # still be reported as a normal HTTP error
+    try:
+        upstream = await client.send(
+            client.build_request("POST", NEXA_URL, content=dump_json(nexa_payload(build_prompt(request), stream=True))),
+            stream=True
+        )
+    except httpx.HTTPError as e:
+        print(f"[ERROR] Request Error: {str(e)[:200]}")
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to connect to Nexa server: {str(e)}"
+        )
+    
+    if upstream.status_code != 200:
+        await upstream.aread()
+        await upstream.aclose()
+        safe_error = safe_ascii(upstream.text)
+        print(f"[ERROR] Nexa API Error: {upstream.status_code}")
+        raise HTTPException(
+            status_code=upstream.status_code,
+            detail=f"Nexa API error: {safe_error[:500]}"
+        )
+    
+    async def relay_tokens():
+        try:
+            async for line in upstream.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                payload = line[5:].strip()
+                if payload == "[DONE]":
+                    break
+                chunk = orjson.loads(payload) if orjson is not None else json.loads(payload)
+                content = chunk["choices"][0].get("delta", {}).get("content")
+                if content:
+                    yield sse_event({"token": content})
+        except Exception as e:
+            error_msg = safe_ascii(e) or "Internal server error occurred"
+            print(f"[ERROR] Stream Exception: {error_msg[:200]}")
+            yield sse_event({"error": error_msg})
+        finally:
+            await upstream.aclose()
+        yield b"data: [DONE]\n\n"
+    
+    # Identity encoding keeps GZipMiddleware from buffering tokens inside its
+    # compressor, so each event reaches the browser as soon as it is relayed
+    return StreamingResponse(
+        relay_tokens(),
+        media_type="text/event-stream",
+        headers={"Content-Encoding": "identity"}
+    )
+
 if __name__ == "__main__":
     print(f"Starting Chat API server...")
     print(f"Connecting to Nexa at: {NEXA_URL}")
     print(f"Using model: {NEXA_MODEL}")
     print(f"Server will run on: http://localhost:8001")
+    print(f"Workers: {WORKERS}")
     
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    # "auto" picks uvloop and httptools when installed (uvicorn[standard]) and
+    # falls back to asyncio/h11 otherwise; uvloop does not support Windows.
+    # Per-request access logging is off to keep it out of the hot path.
+    # The app is passed as an import string, which uvicorn needs to start
+    # more than one worker process.
+    uvicorn.run(
+        "chat_api:app",
+        host="0.0.0.0",
+        port=8001,
+        workers=WORKERS,
+        loop="auto",
+        http="auto",
+        log_level="warning",
+        access_log=False
+    )
 
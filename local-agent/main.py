@@ -1,5 +1,3 @@
-import asyncio
-
 from src.agent import Agent
 from src.tools import tools, tool_descriptions
 
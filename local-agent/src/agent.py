@@ -1,12 +1,18 @@
-import asyncio
+import io
 import os
 import re
-import yaml
+import time
 
+from collections import deque
+from itertools import chain
 from typing import List
+from src.config import load_config
 from src.model import ModelInterface
 from src.tools import Tool
 
+# a tool call is a whole response of the form ToolName(arg)
+_TOOL_CALL_RE = re.compile(r"^(\w+)\((.*)\)$", re.DOTALL)
+
 class Agent:
     def __init__(
         self,
@@ -15,8 +21,7 @@ class Agent:
     ):
         # temporarily read in the configuration for the agent
         # TODO: scope the configuration to only read the agent vars into a dict
-        with open("config.yaml", "r") as f:
-            config = yaml.safe_load(f)
+        config = load_config()
 
         # # # # core agent configuration # # # #
         # model used by the agent
@@ -27,6 +32,8 @@ class Agent:
 
         # system instructions for the agent
         self.core_identity = identity
+        self._identity_msg = {"role": "system", "content": identity}
+        self._long_memory_msg = None
         # # # # # # # # # # # # # # # # # # # #
 
         # # # # agent memory management # # # #
@@ -34,8 +41,10 @@ class Agent:
         self._max_long_memory = config.get("LONG_MEMORY_SIZE", 5096) # tokens
         self._disable_long_memory = config.get("DISABLE_LONG_MEMORY", True)
 
-        self.short_memory = []
         self._max_short_memory = config.get("SHORT_MEMORY_SIZE", 20) # messages
+        self.short_memory = deque(maxlen=self._max_short_memory)
+        # short-term memory pre-formatted as prompt messages, kept in step with short_memory
+        self._short_memory_fmt = deque(maxlen=self._max_short_memory)
         self._disable_short_memory = config.get("DISABLE_SHORT_MEMORY", False)
         # # # # # # # # # # # # # # # # # # # #
 
@@ -49,34 +58,38 @@ class Agent:
         file_header = "Agent Transcript\n================\n\n"
         file_footer = "================\n\n"
 
-        # setup the transcript file
-        with open(self.transcript_file, "w") as f:
-            f.write(file_header)
-        
-        # interaction loop
-        while True:
-            user_input = input("You: ").strip()
-            if user_input.lower() in {"exit", "quit"}:
-                print("Goodbye!")
-                break
-            result = asyncio.run(self.chat_completion(user_input))
-            print(f"Agent: {result}")
-
-            # log the interaction to the transcript file
-            with open(self.transcript_file, "a") as f:
-                f.write(f"You: {user_input}\n\n")
-                f.write(f"Agent: {result}\n\n")
-
-        # close the transcript file, deleting if empty
-        with open(self.transcript_file, "r") as f:
-            content = f.read()
-        if content == file_header:
+        # setup the transcript file, kept open for the whole session; always
+        # UTF-8 so non-ASCII model output can't fail on the locale encoding
+        raw = open(self.transcript_file, "wb", buffering=64 * 1024)
+        self._transcript_fh = io.TextIOWrapper(raw, encoding="utf-8", newline="\n")
+        self._transcript_fh.write(file_header)
+        wrote_any = False
+
+        try:
+            # interaction loop
+            while True:
+                user_input = input("You: ").strip()
+                if user_input.lower() in {"exit", "quit"}:
+                    print("Goodbye!")
+                    break
+                result = self.chat_completion(user_input)
+                print(f"Agent: {result}")
+
+                # log the interaction to the transcript file
+                self._transcript_fh.write(f"You: {user_input}\n\nAgent: {result}\n\n")
+                wrote_any = True
+
+            # finish the transcript file if anything was logged
+            if wrote_any:
+                self._transcript_fh.write(file_footer)
+        finally:
+            self._transcript_fh.close()
+
+        # delete the transcript file if empty
+        if not wrote_any:
             os.remove(self.transcript_file)
-        else:
-            with open(self.transcript_file, "a") as f:
-                f.write(file_footer)
 
-    async def chat_completion(
+    def chat_completion(
         self,
         user_input: str,
     ) -> str:
@@ -88,23 +101,19 @@ class Agent:
         """
         messages = self._build_prompt(user_input)
 
-        tool_call_pattern = re.compile(r"^(\w+)\((.*)\)$", re.DOTALL)
-
         # call the model with the initial request and check for tool calls
-        response = self.model.chat_completion(messages)
-        match = tool_call_pattern.match(response.strip())
-        
-        # process the response
-        result = ""
-        if match:
-            # call tool if a tool call is found
-            name, arg = match.groups()
-            tool = self.tools.get(name)
-            if tool:
-                result = tool.run(arg) if arg else tool.run("")
-        else:
-            result = response
-        result = result.strip()
+        response = self.model.chat_completion(messages).strip()
+
+        # process the response; only responses shaped like ToolName(...) need the regex
+        result = response
+        if response.endswith(")") and "(" in response:
+            match = _TOOL_CALL_RE.match(response)
+            if match:
+                # call tool if a known tool call is found
+                name, arg = match.groups()
+                tool = self.tools.get(name)
+                if tool:
+                    result = tool.run(arg).strip()
         
         # update memory with the interaction
         self._handle_memory(user_input, result)
@@ -125,20 +134,24 @@ class Agent:
 
         """
         
-        # start with the core identity
-        messages = [{"role": "system", "content": self.core_identity}]
+        # start with the core identity (message rebuilt only if the identity changed)
+        if self._identity_msg["content"] is not self.core_identity:
+            self._identity_msg = {"role": "system", "content": self.core_identity}
+        messages = [self._identity_msg]
 
         # then include the long-term memory for broad context (if enabled)
         if not self._disable_long_memory and self.long_memory:
-            messages.append({"role": "system", "content": f"Long-Term Memory:\n{self.long_memory}"})
+            if self._long_memory_msg is None or self._long_memory_msg[0] is not self.long_memory:
+                self._long_memory_msg = (
+                    self.long_memory,
+                    {"role": "system", "content": f"Long-Term Memory:\n{self.long_memory}"}
+                )
+            messages.append(self._long_memory_msg[1])
 
         # next, include the short-term memory for recent events
         if self.short_memory:
             messages.append({"role": "system", "content": "Recent Interactions:"})
-            for message in self.short_memory:
-                role = message["role"]
-                content = message["content"]
-                messages.append({"role": "system", "content": f"{role.capitalize()}: {content}"})
+            messages.extend(self._short_memory_fmt)
         
         # finally, add the current user input
         messages.append({"role": "user", "content": user_input})
@@ -152,37 +165,34 @@ class Agent:
             user_input (str): The latest input from the user.
             assistant_response (str): The latest response from the agent.
         """
+        # nothing is recorded, and so nothing can drop off into long-term memory
         if self._disable_short_memory:
-            pass
-
-        self.short_memory.append({"role": "user", "content": user_input})
-        self.short_memory.append({"role": "assistant", "content": assistant_response})
+            return
 
         popped_messages = []
-        while len(self.short_memory) > self._max_short_memory:
-            popped_messages.append(self.short_memory.pop(0))
+        self._push_short_memory({"role": "user", "content": user_input}, popped_messages)
+        self._push_short_memory({"role": "assistant", "content": assistant_response}, popped_messages)
 
         # handle long memory update
         if popped_messages and not self._disable_long_memory:
-            # Flatten messages for readability
-            popped_messages_text = "\n".join(
-                f"{msg['role'].capitalize()}: {msg['content']}" for msg in popped_messages
-            )
-            short_memory_text = "\n".join(
-                f"{msg['role'].capitalize()}: {msg['content']}" for msg in self.short_memory
-            )
-
-            instruction_content = (
-                "Update the long-term memory summary for this agent.\n"
-                "Previous summary:\n"
-                f"{self.long_memory}\n\n"
-                "Messages that just dropped off short-term memory:\n"
-                f"{popped_messages_text}\n\n"
-                "Current short-term memory:\n"
-                f"{short_memory_text}\n\n"
-                "Please write a concise English summary that includes important context from all of the above, "
-                "without duplicating short-term memory. Respond in English only."
-            )
+            # Flatten messages for readability, reusing the lines formatted
+            # when each message entered short-term memory
+            instruction_content = "\n".join(chain(
+                (
+                    "Update the long-term memory summary for this agent.",
+                    "Previous summary:",
+                    f"{self.long_memory}\n",
+                    "Messages that just dropped off short-term memory:",
+                ),
+                (msg["content"] for msg in popped_messages),
+                ("", "Current short-term memory:"),
+                (msg["content"] for msg in self._short_memory_fmt),
+                (
+                    "",
+                    "Please write a concise English summary that includes important context from all of the above, "
+                    "without duplicating short-term memory. Respond in English only.",
+                ),
+            ))
 
             summary_prompt = [
                 {"role": "system", "content": instruction_content},
@@ -190,8 +200,20 @@ class Agent:
             summary = self.model.chat_completion(summary_prompt)
             self.long_memory = summary.strip()
         
+    def _push_short_memory(self, message: dict, popped_messages: List[dict]) -> None:
+        """
+        Append a message to short-term memory, collecting any message it evicts.
+
+        Args:
+            message (dict): The message to append.
+            popped_messages (List[dict]): Receives the evicted message, if any, as its formatted prompt message.
+        """
+        formatted = {"role": "system", "content": f"{message['role'].capitalize()}: {message['content']}"}
+        if len(self.short_memory) == self.short_memory.maxlen:
+            popped_messages.append(self._short_memory_fmt[0] if self._short_memory_fmt else formatted)
+        self.short_memory.append(message)
+        self._short_memory_fmt.append(formatted)
+
     def _get_timestamp(self) -> str:
         """Get a timestamp string for filenames."""
-        from datetime import datetime
-        now = datetime.now()
-        return now.strftime("%Y%m%d_%H%M%S")
\ No newline at end of file
+        return time.strftime("%Y%m%d_%H%M%S")
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""Configuration loading for the local agent."""
+import functools
+import json
+import os
+from typing import Any, Dict
+
+import yaml
+
+try:
+    # libyaml-backed loader; much faster than the pure-Python one
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CONFIG_PATH = "config.yaml"
+# parsed copy of config.yaml, kept in the same directory and reused while the
+# YAML's modification time and size match the ones recorded in it
+CONFIG_CACHE_NAME = ".config.cache.json"
+
+def _cache_path() -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(CONFIG_PATH)), CONFIG_CACHE_NAME)
+
+def _source_key(stat: os.stat_result) -> list:
+    return [stat.st_mtime_ns, stat.st_size]
+
+def _read_cache(source: list) -> Any:
+    """Return the cached settings, or None if they were parsed from a different config.yaml."""
+    with open(_cache_path(), "rb") as f:
+        data = f.read()
+    cache = orjson.loads(data) if orjson else json.loads(data)
+    if not isinstance(cache, dict) or cache.get("source") != source:
+        return None
+    return cache.get("config")
+
+def _write_cache(stat: os.stat_result, config: Dict[str, Any]) -> None:
+    # The cache holds everything in config.yaml, API keys included, so it is
+    # created with config.yaml's permissions, and it is swapped into place in
+    # one step so a concurrent reader never sees a partial file
+    path = _cache_path()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        cache = {"source": _source_key(stat), "config": config}
+        data = orjson.dumps(cache) if orjson else json.dumps(cache).encode("utf-8")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), stat.st_mode & 0o777)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except (TypeError, ValueError, OSError):
+        # not JSON-serializable or not writable; just parse the YAML next time
+        pass
+
+@functools.lru_cache(maxsize=1)
+def load_config() -> Dict[str, Any]:
+    """
+    Read config.yaml once per process and return the parsed settings.
+
+    Across processes, the parsed settings are cached as JSON and the YAML is
+    only parsed again after it changes. The result is shared between
+    callers, so treat it as read-only.
+    """
+    # an exact match rather than "cache is newer", so a config.yaml replaced
+    # by an older file (cp -p, rsync -a, a restored backup) is still reparsed
+    stat = os.stat(CONFIG_PATH)
+    source = _source_key(stat)
+    try:
+        config = _read_cache(source)
+        if config is not None:
+            return config
+    except (OSError, ValueError):
+        pass
+
+    with open(CONFIG_PATH, "r") as f:
+        config = yaml.load(f, Loader=_Loader) or {}
+    _write_cache(stat, config)
+    return config
@@ -1,7 +1,7 @@
-import yaml
 from typing import List, Dict, Any
 # from openai import OpenAI
 
+from src.config import load_config
 from src.servers.anythingllm import setup_anythingllm_client # , anythingllm_chat_completion
 from src.servers.lmstudio import setup_lm_studio_client # , lmstudio_chat_completion
 from src.servers.nexa import setup_nexa_client # , nexa_chat_completion
@@ -9,28 +9,47 @@ from src.servers.nexa import setup_nexa_client # , nexa_chat_completion
 # A message is a dictionary with a role and content
 Message = Dict[str, str]
 
+def _anythingllm_chat(client, messages: List[Message], temperature: float, stream: bool) -> Any:
+    if stream:
+        raise NotImplementedError("AnythingLLM streaming chat is not implemented yet.")
+    return client.chat(messages)
+
+def _lmstudio_chat(client, messages: List[Message], temperature: float, stream: bool) -> Any:
+    if stream:
+        raise NotImplementedError("LM Studio streaming chat is not implemented yet.")
+    return client.chat(messages, temperature=temperature)
+
+def _nexa_chat(client, messages: List[Message], temperature: float, stream: bool) -> Any:
+    if stream:
+        return client.streaming_chat(messages, temperature=temperature)
+    return client.chat(messages, temperature=temperature)
+
+def _providers() -> Dict[str, tuple]:
+    """
+    Map each provider name (lowercase) to its client setup function and chat call.
+    Built when a model is created, so the setup functions are looked up at that time.
+    """
+    return {
+        "anythingllm": (setup_anythingllm_client, _anythingllm_chat),
+        "lmstudio": (setup_lm_studio_client, _lmstudio_chat),
+        "nexa": (setup_nexa_client, _nexa_chat),
+    }
+
 class ModelInterface:
     def __init__(self):
         """Initialize the model interface."""
         # read the configuration file
-        with open("config.yaml", "r") as f:
-            config = yaml.safe_load(f)
+        config = load_config()
         self.model_provider = config.get("MODEL_PROVIDER", None)
-        self.client = self._setup_client(config)
-
-    def _setup_client(self, config: Dict[str, Any]):
-        """Setup the model client based on the provider."""
         if not self.model_provider:
             raise ValueError("MODEL_PROVIDER is not set in config.yaml")
-        
-        if self.model_provider.lower() == "anythingllm":
-            return setup_anythingllm_client(config)
-        elif self.model_provider.lower() == "lmstudio":
-            return setup_lm_studio_client(config)
-        elif self.model_provider.lower() == "nexa":
-            return setup_nexa_client(config)
-        else:
+
+        # resolve the provider once, so each request skips the provider checks
+        provider = _providers().get(self.model_provider.lower())
+        if provider is None:
             raise ValueError(f"Unsupported MODEL_PROVIDER: {self.model_provider}")
+        setup_client, self._chat_impl = provider
+        self.client = setup_client(config)
 
     def chat_completion(
         self,
@@ -39,40 +58,4 @@ class ModelInterface:
         stream: bool = False
     ) -> Any:
         """Send messages to the language model and get a response."""
-        if not self.model_provider:
-            raise ValueError("MODEL_PROVIDER is not set in config.yaml")
-        
-        if self.model_provider.lower() == "anythingllm":
-            if stream:
-                raise NotImplementedError("AnythingLLM streaming chat is not implemented yet.")
-            return self.client.chat(messages)
-            
-            # return anythingllm_chat_completion(
-            #     client=self.client,
-            #     messages=messages,
-            #     temperature=temperature,
-            #     stream=stream
-            # )
-        elif self.model_provider.lower() == "lmstudio":
-            if stream:
-                raise NotImplementedError("LM Studio streaming chat is not implemented yet.")
-            return self.client.chat(messages, temperature=temperature)
-
-            # return lmstudio_chat_completion(
-            #     client=self.client,
-            #     messages=messages,
-            #     temperature=temperature,
-            #     stream=stream
-            # )
-        elif self.model_provider.lower() == "nexa":
-            if stream:
-                raise NotImplementedError("Nexa streaming chat is not implemented yet.")
-            return self.client.chat(messages, temperature=temperature)
-            # return nexa_chat_completion(
-            #     client=self.client,
-            #     messages=messages,
-            #     temperature=temperature,
-            #     stream=stream
-            # )
-        else:
-            raise ValueError(f"Unsupported MODEL_PROVIDER: {self.model_provider}")
\ No newline at end of file
+        return self._chat_impl(self.client, messages, temperature, stream)
@@ -1,5 +1,18 @@
+import json
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(data: dict) -> bytes:
+    """Serialize a request body; the session already sends the JSON content type."""
+    return orjson.dumps(data) if orjson else json.dumps(data).encode("utf-8")
+
+def _loads(data: bytes):
+    return orjson.loads(data) if orjson else json.loads(data)
+
 class NexaClient:
     def __init__(self, api_url: str, api_key: str, model: str):
         self.api_url = api_url
@@ -11,6 +24,10 @@ class NexaClient:
             "Authorization": f"Bearer {api_key}",
         }
 
+        # Reuse one keep-alive connection across chat calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+
     def chat(self, prompt: str) -> str:
         payload = {
             "model": self.model,
@@ -20,10 +37,9 @@ class NexaClient:
             "stream": False
         }
 
-        response = requests.post(
+        response = self.session.post(
             self.api_url,
-            headers=self.headers,
-            json=payload,
+            data=_dumps(payload),
             timeout=10
         )
         
@@ -32,6 +48,28 @@ class NexaClient:
         except Exception as e:
             return f"Error: {e}"
 
+    def stream_chat(self, prompt: str):
+        """Yield response tokens as the server generates them."""
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": 256,
+            "temperature": 0.7,
+            "stream": True
+        }
+
+        with self.session.post(self.api_url, data=_dumps(payload), stream=True, timeout=10) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    break
+                content = _loads(data)['choices'][0].get('delta', {}).get('content')
+                if content:
+                    yield content
+
 
 # Example usage
 if __name__ == "__main__":
@@ -46,5 +84,11 @@ if __name__ == "__main__":
         if user_input.lower() in {"exit", "quit"}:
             break
 
-        result = client.chat(user_input)
-        print("Nexa:", result)
+        # print tokens as they arrive instead of waiting for the full reply
+        print("Nexa:", end=" ", flush=True)
+        try:
+            for token in client.stream_chat(user_input):
+                print(token, end="", flush=True)
+        except Exception as e:
+            print(f"Error: {e}", end="")
+        print()
@@ -1,5 +1,20 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize a request body; the session already sends the JSON content type."""
+    return orjson.dumps(data) if orjson else json.dumps(data).encode("utf-8")
+
+def _loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson else json.loads(data)
 
 class NexaClient:
     def __init__(self, config: Dict[str, Any]):
@@ -12,6 +27,17 @@ class NexaClient:
             "Authorization": "Bearer " + self.api_key
         }
 
+        # One keep-alive session per client so each chat turn reuses the connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def chat(
         self,
         messages: List[Dict[str, str]],
@@ -26,10 +52,9 @@ class NexaClient:
             "stream": False
         }
 
-        chat_response = requests.post(
+        chat_response = self.session.post(
             self.chat_url,
-            headers=self.headers,
-            json=data
+            data=_dumps(data)
         )
         
         try:
@@ -39,8 +64,32 @@ class NexaClient:
         except Exception as e:
             return f"Chat request failed. Error: {e}"
 
-    def streaming_chat(self):
-        raise NotImplementedError("Nexa streaming chat is not implemented yet.")
+    def streaming_chat(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7
+    ) -> Iterator[str]:
+        """Send a streaming chat request to the Nexa model and yield response tokens as they arrive."""
+        data = {
+            "model": "NexaAI/Llama3.2-3B-NPU-Turbo",
+            "messages": messages,
+            "max_tokens": 256,
+            "temperature": temperature,
+            "stream": True
+        }
+
+        with self.session.post(self.chat_url, data=_dumps(data), stream=True) as chat_response:
+            chat_response.raise_for_status()
+            # server-sent events: one "data: {...}" line per chunk, then "data: [DONE]"
+            for line in chat_response.iter_lines():
+                if not line.startswith(b"data:"):
+                    continue
+                payload = line[5:].strip()
+                if payload == b"[DONE]":
+                    break
+                delta = _loads(payload)["choices"][0].get("delta", {})
+                if delta.get("content"):
+                    yield delta["content"]
 
 def setup_nexa_client(
     config: Dict[str, Any]
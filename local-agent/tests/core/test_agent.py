@@ -4,7 +4,6 @@ import tempfile
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
 import pytest
-import asyncio
 from src.agent import Agent
 from src.tools import Tool
 
@@ -34,5 +33,62 @@ def test_agent_tool_call(monkeypatch):
     agent = Agent(tools, "Test agent identity")
     # Simulate a tool call response
     agent.model.chat_completion = lambda messages: "Echo(test)"
-    result = asyncio.run(agent.chat_completion("test"))
+    result = agent.chat_completion("test")
     assert result == "Echo: test"
+
+def test_agent_short_memory_eviction(monkeypatch):
+    monkeypatch.setattr("src.agent.load_config", lambda: {"SHORT_MEMORY_SIZE": 2, "DISABLE_LONG_MEMORY": False})
+    monkeypatch.setattr("src.agent.ModelInterface", lambda: DummyModel())
+    agent = Agent([], "Test agent identity")
+    prompts = []
+    def chat_completion(messages):
+        prompts.append(messages)
+        return "Hello, world!"
+    agent.model.chat_completion = chat_completion
+
+    agent.chat_completion("first")
+    assert len(prompts) == 1
+
+    # the second exchange pushes the first one out of short-term memory
+    agent.chat_completion("second")
+    assert {"role": "system", "content": "User: first"} in prompts[1]
+    assert list(agent.short_memory) == [
+        {"role": "user", "content": "second"},
+        {"role": "assistant", "content": "Hello, world!"},
+    ]
+    assert [msg["content"] for msg in agent._short_memory_fmt] == ["User: second", "Assistant: Hello, world!"]
+
+    # the evicted lines are summarized into long-term memory
+    assert len(prompts) == 3
+    summary_prompt = prompts[2][0]["content"]
+    dropped, current = summary_prompt.split("Current short-term memory:")
+    assert "User: first\nAssistant: Hello, world!" in dropped
+    assert "User: second\nAssistant: Hello, world!" in current
+    assert agent.long_memory == "Hello, world!"
+
+def test_agent_unknown_tool_returns_text(monkeypatch):
+    monkeypatch.setattr("src.agent.load_config", lambda: {})
+    monkeypatch.setattr("src.agent.ModelInterface", lambda: DummyModel())
+    agent = Agent([], "Test agent identity")
+    # Looks like a tool call, but no such tool is registered
+    agent.model.chat_completion = lambda messages: "Unknown(test)"
+    assert agent.chat_completion("test") == "Unknown(test)"
+
+def test_agent_disabled_short_memory(monkeypatch):
+    monkeypatch.setattr("src.agent.load_config", lambda: {
+        "SHORT_MEMORY_SIZE": 2, "DISABLE_SHORT_MEMORY": True, "DISABLE_LONG_MEMORY": False
+    })
+    monkeypatch.setattr("src.agent.ModelInterface", lambda: DummyModel())
+    agent = Agent([], "Test agent identity")
+    calls = []
+    agent.model.chat_completion = lambda messages: calls.append(messages) or "Hello, world!"
+    for message in ["one", "two", "three"]:
+        agent.chat_completion(message)
+    assert len(agent.short_memory) == 0
+    assert len(agent._short_memory_fmt) == 0
+    # no summary requests, and no history in the prompts
+    assert len(calls) == 3
+    assert calls[-1] == [
+        {"role": "system", "content": "Test agent identity"},
+        {"role": "user", "content": "three"},
+    ]
@@ -0,0 +1,48 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+import src.config
+from src.config import load_config
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+    path = tmp_path / "config.yaml"
+    path.write_text("MODEL_PROVIDER: nexa\n")
+    monkeypatch.setattr("src.config.CONFIG_PATH", str(path))
+    load_config.cache_clear()
+    yield path
+    load_config.cache_clear()
+
+def test_load_config_writes_cache_next_to_config(config_path, monkeypatch):
+    monkeypatch.chdir(config_path.parent.parent)
+    assert load_config() == {"MODEL_PROVIDER": "nexa"}
+    assert (config_path.parent / src.config.CONFIG_CACHE_NAME).exists()
+
+def test_load_config_reuses_cache(config_path, monkeypatch):
+    load_config()
+    load_config.cache_clear()
+    # an unchanged config.yaml is served from the cache without parsing
+    def fail(*args, **kwargs):
+        raise AssertionError("config.yaml was parsed again")
+    monkeypatch.setattr("src.config.yaml.load", fail)
+    assert load_config() == {"MODEL_PROVIDER": "nexa"}
+
+def test_load_config_reparses_older_replacement(config_path):
+    load_config()
+    load_config.cache_clear()
+    # replace config.yaml with a file whose timestamp is older than the cache
+    stat = os.stat(config_path)
+    config_path.write_text("MODEL_PROVIDER: lmstudio\n")
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+    assert load_config() == {"MODEL_PROVIDER": "lmstudio"}
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file permissions")
+def test_load_config_cache_keeps_config_permissions(config_path):
+    os.chmod(config_path, 0o600)
+    load_config()
+    cache_path = config_path.parent / src.config.CONFIG_CACHE_NAME
+    assert os.stat(cache_path).st_mode & 0o777 == 0o600
+    # only the cache itself is left behind, no temporary files
+    assert sorted(p.name for p in config_path.parent.iterdir()) == [src.config.CONFIG_CACHE_NAME, "config.yaml"]
@@ -3,27 +3,63 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
 import pytest
-import io
 from src.model import ModelInterface
 
 class DummyClient:
     pass
 
+class RecordingClient:
+    def __init__(self):
+        self.calls = []
+
+    def chat(self, messages, **kwargs):
+        self.calls.append(("chat", messages, kwargs))
+        return "response"
+
+    def streaming_chat(self, messages, **kwargs):
+        self.calls.append(("streaming_chat", messages, kwargs))
+        return iter(["res", "ponse"])
+
 def test_model_provider_config(monkeypatch):
-    config_yaml = "MODEL_PROVIDER: anythingllm"
-    mock_file = io.StringIO(config_yaml)
-    monkeypatch.setattr("builtins.open", lambda f, mode="r": mock_file)
+    monkeypatch.setattr("src.model.load_config", lambda: {"MODEL_PROVIDER": "anythingllm"})
     monkeypatch.setattr("src.model.setup_anythingllm_client", lambda config: DummyClient())
     model = ModelInterface()
     assert model.model_provider == "anythingllm"
     assert isinstance(model.client, DummyClient)
 
 def test_model_chat_completion(monkeypatch):
-    config_yaml = "MODEL_PROVIDER: anythingllm"
-    mock_file = io.StringIO(config_yaml)
-    monkeypatch.setattr("builtins.open", lambda f, mode="r": mock_file)
-    monkeypatch.setattr("src.model.setup_anythingllm_client", lambda config: DummyClient())
-    monkeypatch.setattr("src.model.anythingllm_chat_completion", lambda client, messages, temperature, stream: "response")
+    monkeypatch.setattr("src.model.load_config", lambda: {"MODEL_PROVIDER": "anythingllm"})
+    monkeypatch.setattr("src.model.setup_anythingllm_client", lambda config: RecordingClient())
     model = ModelInterface()
     result = model.chat_completion([{"role": "user", "content": "hi"}])
     assert result == "response"
+    assert model.client.calls == [("chat", [{"role": "user", "content": "hi"}], {})]
+    with pytest.raises(NotImplementedError):
+        model.chat_completion([{"role": "user", "content": "hi"}], stream=True)
+
+def test_model_lmstudio_chat_completion(monkeypatch):
+    monkeypatch.setattr("src.model.load_config", lambda: {"MODEL_PROVIDER": "LMStudio"})
+    monkeypatch.setattr("src.model.setup_lm_studio_client", lambda config: RecordingClient())
+    model = ModelInterface()
+    messages = [{"role": "user", "content": "hi"}]
+    assert model.chat_completion(messages, temperature=0.2) == "response"
+    assert model.client.calls == [("chat", messages, {"temperature": 0.2})]
+    with pytest.raises(NotImplementedError):
+        model.chat_completion(messages, stream=True)
+
+def test_model_nexa_chat_completion(monkeypatch):
+    monkeypatch.setattr("src.model.load_config", lambda: {"MODEL_PROVIDER": "nexa"})
+    monkeypatch.setattr("src.model.setup_nexa_client", lambda config: RecordingClient())
+    model = ModelInterface()
+    messages = [{"role": "user", "content": "hi"}]
+    assert model.chat_completion(messages) == "response"
+    assert "".join(model.chat_completion(messages, temperature=0.2, stream=True)) == "response"
+    assert model.client.calls == [
+        ("chat", messages, {"temperature": 0.7}),
+        ("streaming_chat", messages, {"temperature": 0.2}),
+    ]
+
+def test_model_unsupported_provider(monkeypatch):
+    monkeypatch.setattr("src.model.load_config", lambda: {"MODEL_PROVIDER": "other"})
+    with pytest.raises(ValueError):
+        ModelInterface()
@@ -0,0 +1,56 @@
+import sys
+import os
+import json
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.servers.nexa import NexaClient
+
+class FakeStreamResponse:
+    def __init__(self, lines):
+        self.lines = lines
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self):
+        return iter(self.lines)
+
+class FakeSession:
+    def __init__(self, lines):
+        self.lines = lines
+        self.requests = []
+
+    def post(self, url, **kwargs):
+        self.requests.append((url, kwargs))
+        return FakeStreamResponse(self.lines)
+
+def delta_line(delta):
+    return b"data: " + json.dumps({"choices": [{"delta": delta}]}).encode("utf-8")
+
+def test_streaming_chat_yields_tokens():
+    client = NexaClient({"NEXA_URL": "http://127.0.0.1:18181/v1/chat/completions", "NEXA_API_KEY": "nexa"})
+    client.session = FakeSession([
+        delta_line({"role": "assistant"}),
+        b"",
+        b": keep-alive",
+        delta_line({"content": "Hello"}),
+        delta_line({"content": ", world!"}),
+        b"data: [DONE]",
+        delta_line({"content": "ignored"}),
+    ])
+    messages = [{"role": "user", "content": "hi"}]
+    assert list(client.streaming_chat(messages, temperature=0.2)) == ["Hello", ", world!"]
+
+    url, kwargs = client.session.requests[0]
+    assert url == "http://127.0.0.1:18181/v1/chat/completions"
+    assert kwargs["stream"] is True
+    body = json.loads(kwargs["data"])
+    assert body["messages"] == messages
+    assert body["temperature"] == 0.2
+    assert body["stream"] is True
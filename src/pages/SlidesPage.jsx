@@ -874,8 +874,8 @@ const SlidesPage = () => {
       console.log('Slide Content:', slideContent);
       console.log('================');
       
-      // Call Chat API (proxy to Nexa LLM)
-      const response = await fetch('http://localhost:8001/chat', {
+      // Call Chat API (proxy to Nexa LLM), streaming the response
+      const response = await fetch('http://localhost:8001/chat/stream', {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -891,8 +891,27 @@ const SlidesPage = () => {
         throw new Error(errorData.detail || `Chat API error: ${response.status}`);
       }
       
-      const data = await response.json();
-      const aiResponse = data.response;
+      // Read server-sent events and show tokens in the loading message as they arrive
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      let aiResponse = '';
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const events = buffer.split('\n\n');
+        buffer = events.pop();
+        for (const event of events) {
+          if (!event.startsWith('data: ')) continue;
+          const data = event.slice(6);
+          if (data === '[DONE]') continue;
+          const parsed = JSON.parse(data);
+          if (parsed.error) throw new Error(parsed.error);
+          aiResponse += parsed.token;
+          setMessages(prev => [...prev.slice(0, -1), { ...prev[prev.length - 1], text: aiResponse }]);
+        }
+      }
       
       // Debug: Log the AI response
       console.log('AI Response:', aiResponse);